@@ -3,12 +3,13 @@ Configuration settings for the Discord bot
 """
 
 import os
+import time
 import logging
 
 # Optional imports with graceful fallbacks - no more dependency errors!
 try:
     import pymongo
-    from pymongo import MongoClient
+    from pymongo import MongoClient, DeleteMany, InsertOne, ReplaceOne
     PYMONGO_AVAILABLE = True
 except ImportError:
     PYMONGO_AVAILABLE = False
@@ -35,6 +36,7 @@ BOT_CONFIG = {
 DISCORD_BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN', '')
 BOT_OWNER_ID = int(os.getenv('BOT_OWNER_ID', '0'))
 MONGO_URI = os.getenv('MONGO_URI', '')
+REDIS_URL = os.getenv('REDIS_URL', '')  # Optional - shares command cooldowns across clusters
 
 # Import custom emojis
 from src.emojis import SPROUTS_CHECK, SPROUTS_ERROR, SPROUTS_WARNING, SPROUTS_INFORMATION, get_emoji
@@ -67,11 +69,32 @@ COMMAND_COOLDOWNS = {
     'info': 10
 }
 
+# Fixed _id for collections that store a single settings document
+SINGLETON_DOCUMENT_ID = 'singleton'
+
 # MongoDB Connection Handler
 class MongoDBHandler:
+    __slots__ = ("client", "db", "_next_connect_at", "_connected")
+    
+    # Seconds to wait after a failed attempt before pinging the server again
+    RECONNECT_INTERVAL = 60
+    
     def __init__(self):
         self.client = None
         self.db = None
+        # Connecting pings the server (up to 3s), so it waits for the first use
+        # (made from a worker thread at startup) instead of blocking every import of config
+        self._next_connect_at = 0.0
+        self._connected = False
+    
+    def _ensure_connected(self):
+        """Attempt a connection, at most once per RECONNECT_INTERVAL while down"""
+        if self._connected:
+            return
+        now = time.monotonic()
+        if now < self._next_connect_at:
+            return
+        self._next_connect_at = now + self.RECONNECT_INTERVAL
         self._connect()
     
     def _connect(self):
@@ -81,6 +104,8 @@ class MongoDBHandler:
                 logger.info("MongoDB package not available - using JSON storage")
             else:
                 logger.warning("MONGO_URI not set - using JSON storage")
+            # Nothing to retry without a URI or the driver
+            self._next_connect_at = float('inf')
             return
         
         logger.info("Attempting quick MongoDB connection...")
@@ -105,6 +130,7 @@ class MongoDBHandler:
             # Quick ping test
             self.client.admin.command('ping')
             self.db = self.client.sprouts_bot
+            self._connected = True
             logger.info("MongoDB connected successfully!")
             return
             
@@ -120,7 +146,20 @@ class MongoDBHandler:
     
     def is_connected(self):
         """Check if MongoDB is connected"""
-        return self.client is not None and self.db is not None
+        self._ensure_connected()
+        return self._connected
+    
+    def _mark_disconnected(self):
+        """Drop a connection that failed mid-operation; reconnects wait out RECONNECT_INTERVAL"""
+        self._connected = False
+        self._next_connect_at = time.monotonic() + self.RECONNECT_INTERVAL
+        if self.client:
+            try:
+                self.client.close()
+            except:
+                pass
+        self.client = None
+        self.db = None
     
     def get_collection(self, name):
         """Get a MongoDB collection"""
@@ -134,15 +173,24 @@ class MongoDBHandler:
             return False
         try:
             collection = self.get_collection(collection_name)
-            # Clear existing data and insert new
-            collection.delete_many({})
+            # Replace the stored data in one ordered bulk write to save round trips.
+            # This is not atomic: a concurrent reader can still see the collection
+            # empty or partly written between the delete and the inserts
             if isinstance(data, dict) and data:
-                collection.insert_one(data)
+                requests = [
+                    DeleteMany({'_id': {'$ne': SINGLETON_DOCUMENT_ID}}),
+                    ReplaceOne({'_id': SINGLETON_DOCUMENT_ID}, {**data, '_id': SINGLETON_DOCUMENT_ID}, upsert=True)
+                ]
             elif isinstance(data, list) and data:
-                collection.insert_many(data)
+                requests = [DeleteMany({})] + [InsertOne(dict(item)) for item in data]
+            else:
+                requests = [DeleteMany({})]
+            collection.bulk_write(requests, ordered=True)
             return True
         except Exception as e:
             logger.error(f"Error saving to {collection_name}: {e}")
+            if isinstance(e, pymongo.errors.ConnectionFailure):
+                self._mark_disconnected()
             return False
     
     def load_json_data(self, collection_name, default=None):
@@ -152,17 +200,23 @@ class MongoDBHandler:
             
         try:
             collection = self.get_collection(collection_name)
-            data = list(collection.find({}, {'_id': 0}))  # Exclude MongoDB _id
-            
-            if not data:
+            # Stream the cursor (excluding MongoDB _id) so the common single-document
+            # case only ever holds that one document
+            cursor = collection.find({}, {'_id': 0}, batch_size=500)
+            first = next(cursor, None)
+            if first is None:
                 return default if default is not None else {}
-            elif len(data) == 1:
-                return data[0]
-            else:
-                return data
+            
+            second = next(cursor, None)
+            if second is None:
+                cursor.close()
+                return first
+            return [first, second, *cursor]
                 
         except Exception as e:
             logger.error(f"Error loading from {collection_name}: {e}")
+            if isinstance(e, pymongo.errors.ConnectionFailure):
+                self._mark_disconnected()
             return default if default is not None else {}
 
 # Initialize MongoDB handler
@@ -7,9 +7,10 @@ import asyncio
 import logging
 import discord
 from discord.ext import commands
-from config import BOT_CONFIG, EMBED_COLOR_ERROR, BOT_OWNER_ID
+from config import BOT_CONFIG, EMBED_COLOR_ERROR, BOT_OWNER_ID, mongodb
 from emojis import SPROUTS_ERROR
 from web_viewer import bot_stats
+from src.cogs.guild_settings import guild_settings
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,6 @@ class DiscordBot(commands.AutoShardedBot):
         # Add custom guild prefix if in a guild
         if message.guild:
             try:
-                # Import guild_settings here to avoid circular imports
-                from cogs.guild_settings import guild_settings
                 guild_prefix = guild_settings.get_prefix(message.guild.id)
                 if guild_prefix and guild_prefix != BOT_CONFIG['prefix']:
                     base_prefixes.append(guild_prefix)
@@ -62,6 +61,9 @@ class DiscordBot(commands.AutoShardedBot):
         """Called when the bot is starting up"""
         logger.info("Bot is starting up...")
         
+        # Make the first MongoDB connection attempt (a blocking ping) off the event loop
+        await asyncio.to_thread(mongodb.is_connected)
+        
         # Initialize data manager and create startup backup
         from data_manager import data_manager
         await data_manager.auto_backup_on_startup()
@@ -225,6 +227,11 @@ class DiscordBot(commands.AutoShardedBot):
         # Start with clean presence
         logger.info("Bot started with clean presence - use setstatus/setactivity commands to customize")
     
+    async def close(self):
+        """Flush deferred settings writes before shutting down"""
+        await guild_settings.flush()
+        await super().close()
+    
     async def on_shard_ready(self, shard_id):
         """Called when a specific shard is ready"""
         guild_count = len([guild for guild in self.guilds if guild.shard_id == shard_id])
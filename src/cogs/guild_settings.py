@@ -3,6 +3,7 @@ Guild Settings Management
 Handles per-guild settings like custom prefixes
 """
 
+import asyncio
 import json
 import os
 import logging
@@ -17,6 +18,11 @@ class GuildSettings:
         self.settings_file = "config/guild_settings.json"
         self.settings = self.load_settings()
         self.default_prefix = "s."
+        self.save_delay = 0.5
+        self._save_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        # Resolved prefix per guild id; get_prefix runs for every incoming message
+        self._prefix_cache: Dict[int, str] = {}
     
     def load_settings(self) -> Dict:
         """Load guild settings from file"""
@@ -30,19 +36,61 @@ class GuildSettings:
     
     def save_settings(self):
         """Save guild settings to file"""
+        self._write_settings(json.dumps(self.settings, indent=2))
+    
+    def _write_settings(self, payload: str):
+        """Write already serialized settings to file"""
         try:
             with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+                f.write(payload)
         except Exception as e:
             logger.error(f"Error saving guild settings: {e}")
     
+    def _persist(self):
+        """Save now when called outside the event loop, otherwise defer to a background write"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save_settings()
+            return
+        
+        if self._save_task is None or self._save_task.done():
+            self._save_task = loop.create_task(self._delayed_save())
+    
+    async def _delayed_save(self):
+        """Write-behind task that coalesces changes made within save_delay seconds"""
+        await asyncio.sleep(self.save_delay)
+        # Snapshot on the loop thread so the file thread never sees a dict mid-update
+        payload = json.dumps(self.settings, indent=2)
+        self._save_task = None
+        async with self._write_lock:
+            await asyncio.to_thread(self._write_settings, payload)
+    
+    async def flush(self):
+        """Write any deferred save now; called on shutdown so recent changes aren't lost"""
+        pending = self._save_task is not None and not self._save_task.done()
+        if pending:
+            self._save_task.cancel()
+            self._save_task = None
+        # Taking the lock also waits out a write that is already in flight
+        async with self._write_lock:
+            if pending:
+                await asyncio.to_thread(self._write_settings, json.dumps(self.settings, indent=2))
+    
     def get_prefix(self, guild_id: Optional[int]) -> str:
         """Get prefix for a guild"""
         if guild_id is None:
             return self.default_prefix
         
-        guild_str = str(guild_id)
-        return self.settings.get(guild_str, {}).get('prefix', self.default_prefix)
+        prefix = self._prefix_cache.get(guild_id)
+        if prefix is None:
+            prefix = self.settings.get(str(guild_id), {}).get('prefix', self.default_prefix)
+            self._prefix_cache[guild_id] = prefix
+        return prefix
+    
+    def invalidate_prefix(self, guild_id: int):
+        """Drop the cached prefix for a guild so the next lookup rereads settings"""
+        self._prefix_cache.pop(guild_id, None)
     
     def set_prefix(self, guild_id: int, prefix: str):
         """Set prefix for a guild"""
@@ -51,7 +99,8 @@ class GuildSettings:
             self.settings[guild_str] = {}
         
         self.settings[guild_str]['prefix'] = prefix
-        self.save_settings()
+        self.invalidate_prefix(guild_id)
+        self._persist()
     
     def get_all_guild_settings(self, guild_id: int) -> Dict:
         """Get all settings for a guild"""
@@ -65,7 +114,9 @@ class GuildSettings:
             self.settings[guild_str] = {}
         
         self.settings[guild_str][key] = value
-        self.save_settings()
+        if key == 'prefix':
+            self.invalidate_prefix(guild_id)
+        self._persist()
 
 # Global instance
 guild_settings = GuildSettings()
\ No newline at end of file
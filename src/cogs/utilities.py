@@ -6,15 +6,253 @@ Provides various utility commands including server info, user info, and variable
 import discord
 from discord.ext import commands
 import logging
+import re
 import asyncio
-from datetime import datetime
+import functools
+import itertools
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from config import EMBED_COLOR_NORMAL, EMBED_COLOR_SUCCESS, EMBED_COLOR_ERROR, EMBED_COLOR_WARNING, SPROUTS_ERROR, SPROUTS_CHECK, SPROUTS_WARNING, SPROUTS_INFORMATION
+from src.cogs.guild_settings import guild_settings
+from src.cogs.help import HelpPaginationView
+from src.utils.shared_cooldown import shared_cooldown
+
+# Only the Test Variables button needs the processor; the cog still loads without it
+try:
+    from src.utils.variable_processor import variable_processor
+except ImportError:
+    variable_processor = None
 
 logger = logging.getLogger(__name__)
 
+# Invite info embeds are reused for a short while so repeated lookups skip the API
+INVITE_CACHE_TTL = 30
+INVITE_CACHE_SIZE = 256
+# Bare invite codes or discord.gg / discord.com/invite links, ignoring trailing slashes and query strings
+_INVITE_RE = re.compile(r'(?:(?:https?://)?(?:www\.)?(?:discord(?:app)?\.com/invite|discord\.gg)/)?([a-zA-Z0-9-]{2,32})/?(?:\?\S*)?')
+
+# Guild features are a small fixed set, so the prettified names are cached once
+@functools.lru_cache(maxsize=64)
+def _pretty_feature(feature):
+    """Return a display name for a raw guild feature string"""
+    return feature.replace("_", " ").title()
+
+
+@functools.lru_cache(maxsize=4096)
+def _unix(dt):
+    """Unix timestamp of a datetime, memoized for repeatedly shown users/guilds"""
+    return int(dt.timestamp())
+
+
+def _snowflake_ts(snowflake_id):
+    """Unix timestamp encoded in a Discord snowflake id, without building a datetime"""
+    return ((snowflake_id >> 22) + discord.utils.DISCORD_EPOCH) // 1000
+
+
+@functools.lru_cache(maxsize=16384)
+def _fmt_dt(ts, style='F'):
+    """Discord timestamp markup for a unix time, reused across repeated renders"""
+    return f"<t:{ts}:{style}>"
+
+
+def _reply_on_error(action):
+    """Wrap a command handler so failures are logged and answered with a plain error reply"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, ctx, *args, **kwargs):
+            try:
+                return await func(self, ctx, *args, **kwargs)
+            except (discord.HTTPException, ValueError, KeyError) as e:
+                logger.error(f"Error in {func.__name__} command: {e}")
+                await ctx.reply(f"An error occurred while {action}.", mention_author=False)
+        return wrapper
+    return decorator
+
+
+# Key permissions listed by roleinfo, as (permission bit, label) pairs
+_ADMINISTRATOR_BIT = discord.Permissions.administrator.flag
+_KEY_PERM_BITS = tuple(
+    (getattr(discord.Permissions, name).flag, label)
+    for name, label in (
+        ("manage_guild", "Manage Server"),
+        ("manage_channels", "Manage Channels"),
+        ("manage_roles", "Manage Roles"),
+        ("manage_messages", "Manage Messages"),
+        ("kick_members", "Kick Members"),
+        ("ban_members", "Ban Members"),
+    )
+)
+
+
+# Text-based presence status for SPROUTS consistency
+_STATUS_TEXT = {
+    discord.Status.online: "Online",
+    discord.Status.idle: "Away",
+    discord.Status.dnd: "Do Not Disturb",
+    discord.Status.offline: "Offline",
+    discord.Status.invisible: "Offline"  # Discord shows invisible as offline
+}
+
+
+def _format_listening(activity):
+    """Spotify activities carry title/artist, other listening activities only a name"""
+    if hasattr(activity, 'title') and hasattr(activity, 'artist'):
+        return f"Listening to {activity.title} by {activity.artist}"
+    return f"Listening to {activity.name}"
+
+
+_ACTIVITY_FORMATTERS = {
+    discord.ActivityType.playing: lambda activity: f"Playing {activity.name}",
+    discord.ActivityType.listening: _format_listening,
+    discord.ActivityType.watching: lambda activity: f"Watching {activity.name}",
+    discord.ActivityType.streaming: lambda activity: f"Streaming {activity.name}",
+    discord.ActivityType.custom: lambda activity: activity.name,
+}
+
+
+def _activity_text(member):
+    """Describe the first recognised activity of a member"""
+    for activity in member.activities:
+        formatter = _ACTIVITY_FORMATTERS.get(activity.type)
+        text = formatter(activity) if formatter else None
+        if text:
+            return text
+    return "None"
+
+
+# Variable reference blocks, joined once at import and shared by both variables layouts
+_USER_VARS_BLOCK = "\n".join((
+    "`$(user.name)` - User's username",
+    "`$(user.mention)` - Mentions the user",
+    "`$(user.id)` - User's Discord ID",
+    "`$(user.nick)` - User's server nickname",
+    "`$(user.tag)` - Full username with discriminator",
+    "`$(user.avatar)` - User's avatar image URL",
+    "`$(user.joined)` - Date user joined the server",
+    "`$(user.created)` - Date user account was created",
+))
+_SERVER_VARS_BLOCK = "\n".join((
+    "`$(server.name)` - Server name",
+    "`$(server.membercount)` - Total member count",
+    "`$(server.owner)` - Server owner's name",
+    "`$(server.id)` - Server's Discord ID",
+    "`$(server.icon)` - Server icon image URL",
+    "`$(server.created)` - Date server was created",
+    "`$(server.boosts)` - Number of server boosts",
+    "`$(server.channels)` - Total channel count",
+))
+_CHANNEL_VARS = (
+    "`$(channel.name)` - Current channel name",
+    "`$(channel.id)` - Channel's Discord ID",
+    "`$(channel.mention)` - Mentions the current channel",
+    "`$(channel.topic)` - Channel's topic description",
+    "`$(channel.category)` - Channel's category name",
+    "`$(channel.position)` - Channel's position in list",
+    "`$(channel.created)` - Date channel was created",
+    "`$(channel.nsfw)` - Whether channel is NSFW",
+    "`$(channel.slowmode)` - Channel slowmode delay",
+)
+_CHANNEL_VARS_BLOCK = "\n".join(_CHANNEL_VARS)
+_TIME_VARS_BLOCK = "\n".join((
+    "`$(time)` - Current time",
+    "`$(date)` - Current date",
+    "`$(datetime)` - Current date and time",
+    "`$(year)` - Current year",
+    "`$(month)` - Current month name",
+    "`$(day)` - Current day of month",
+    "`$(weekday)` - Current day of week",
+    "`$(timestamp)` - Unix timestamp",
+))
+_SPECIAL_VARS_BLOCK = "\n".join((
+    "`$(math:5+5)` - Basic math operations (+, -, *, /, ())",
+    "`$(random:1-100)` - Random number in range",
+    "`$(choose:a|b|c)` - Random choice from list",
+    "`$(len:text)` - String length calculator",
+    "`$(upper:text)` - Convert to uppercase",
+    "`$(if:user.bot?Bot:Human)` - Conditional logic",
+    "",
+    "**Format:** `$(if:condition?true:false)`",
+))
+_TICKET_VARS = (
+    "`$(ticket.id)` - Ticket's unique ID number",
+    "`$(ticket.creator)` - User who created ticket",
+    "`$(ticket.category)` - Ticket category name",
+    "`$(ticket.status)` - Current ticket status",
+    "`$(ticket.staff)` - Staff member assigned",
+    "`$(ticket.claimed)` - Is ticket claimed (Yes/No)",
+    "`$(ticket.tags)` - List of ticket tags",
+    "`$(ticket.panel)` - Panel used to create ticket",
+    "`$(ticket.transcript)` - Transcript download URL",
+)
+_TICKET_VARS_BLOCK = "\n".join(_TICKET_VARS)
+# The variables command's condensed pages list only the core channel and ticket entries
+_CHANNEL_VARS_BASIC_BLOCK = "\n".join(_CHANNEL_VARS[:6])
+_TICKET_VARS_BASIC_BLOCK = "\n".join(_TICKET_VARS[:8])
+
+# Page titles with the information emoji resolved once at import
+_TITLE_USER = f'{SPROUTS_INFORMATION} User Variables'
+_TITLE_SERVER = f'{SPROUTS_INFORMATION} Server Variables'
+_TITLE_CHANNEL = f'{SPROUTS_INFORMATION} Channel Variables'
+_TITLE_TIME = f'{SPROUTS_INFORMATION} Time Variables'
+_TITLE_SPECIAL = f'{SPROUTS_INFORMATION} Math & Logic Variables'
+_TITLE_TICKET = f'{SPROUTS_INFORMATION} Advanced Ticket Variables'
+
+# Static variable reference pages shared by every VariablesView
+_VARIABLE_PAGES = (
+    {
+        'title': _TITLE_USER,
+        'description': 'Variables related to users and members',
+        'content': _USER_VARS_BLOCK
+    },
+    {
+        'title': _TITLE_SERVER,
+        'description': 'Variables related to the current server/guild',
+        'content': _SERVER_VARS_BLOCK
+    },
+    {
+        'title': _TITLE_CHANNEL,
+        'description': 'Variables related to the current channel',
+        'content': _CHANNEL_VARS_BLOCK
+    },
+    {
+        'title': _TITLE_TIME,
+        'description': 'Variables for current date and time information',
+        'content': _TIME_VARS_BLOCK
+    },
+    {
+        'title': _TITLE_SPECIAL,
+        'description': 'Advanced variables with calculations and logic',
+        'content': _SPECIAL_VARS_BLOCK
+    },
+    {
+        'title': _TITLE_TICKET,
+        'description': 'Specialized variables for ticket system',
+        'content': _TICKET_VARS_BLOCK
+    }
+)
+
+# Usage examples shown under every VariablesView page
+_USAGE_EXAMPLES = "\n".join((
+    "• In embeds: `$(user.name)` → Actual username",
+    "• Mix text: `Welcome $(user.mention) to $(server.name)!`",
+    "• Math: `You rolled $(random:1-6)!`",
+    "• Logic: `$(if:channel.nsfw?NSFW Content:Safe Channel)`",
+))
+
+# One select option per page so users can jump straight to a category
+_VARIABLE_PAGE_OPTIONS = [
+    discord.SelectOption(
+        label=page['title'].removeprefix(f'{SPROUTS_INFORMATION} '),
+        description=page['description'],
+        value=str(index)
+    )
+    for index, page in enumerate(_VARIABLE_PAGES)
+]
+
 
 class VariablesView(discord.ui.View):
-    """Paginated view for displaying all variable categories"""
+    """Category picker view for displaying all variable categories"""
     
     def __init__(self, user):
         super().__init__(timeout=300)
@@ -22,38 +260,7 @@ class VariablesView(discord.ui.View):
         self.current_page = 0
         self.message = None
         
-        self.pages = [
-            {
-                'title': f'{SPROUTS_INFORMATION} User Variables',
-                'description': 'Variables related to users and members',
-                'content': '`$(user.name)` - User\'s username\n`$(user.mention)` - Mentions the user\n`$(user.id)` - User\'s Discord ID\n`$(user.nick)` - User\'s server nickname\n`$(user.tag)` - Full username with discriminator\n`$(user.avatar)` - User\'s avatar image URL\n`$(user.joined)` - Date user joined the server\n`$(user.created)` - Date user account was created'
-            },
-            {
-                'title': f'{SPROUTS_INFORMATION} Server Variables', 
-                'description': 'Variables related to the current server/guild',
-                'content': '`$(server.name)` - Server name\n`$(server.membercount)` - Total member count\n`$(server.owner)` - Server owner\'s name\n`$(server.id)` - Server\'s Discord ID\n`$(server.icon)` - Server icon image URL\n`$(server.created)` - Date server was created\n`$(server.boosts)` - Number of server boosts\n`$(server.channels)` - Total channel count'
-            },
-            {
-                'title': f'{SPROUTS_INFORMATION} Channel Variables',
-                'description': 'Variables related to the current channel', 
-                'content': '`$(channel.name)` - Current channel name\n`$(channel.id)` - Channel\'s Discord ID\n`$(channel.mention)` - Mentions the current channel\n`$(channel.topic)` - Channel\'s topic description\n`$(channel.category)` - Channel\'s category name\n`$(channel.position)` - Channel\'s position in list\n`$(channel.created)` - Date channel was created\n`$(channel.nsfw)` - Whether channel is NSFW\n`$(channel.slowmode)` - Channel slowmode delay'
-            },
-            {
-                'title': f'{SPROUTS_INFORMATION} Time Variables',
-                'description': 'Variables for current date and time information',
-                'content': '`$(time)` - Current time\n`$(date)` - Current date\n`$(datetime)` - Current date and time\n`$(year)` - Current year\n`$(month)` - Current month name\n`$(day)` - Current day of month\n`$(weekday)` - Current day of week\n`$(timestamp)` - Unix timestamp'
-            },
-            {
-                'title': f'{SPROUTS_INFORMATION} Math & Logic Variables',
-                'description': 'Advanced variables with calculations and logic',
-                'content': '`$(math:5+5)` - Basic math operations (+, -, *, /, ())\n`$(random:1-100)` - Random number in range\n`$(choose:a|b|c)` - Random choice from list\n`$(len:text)` - String length calculator\n`$(upper:text)` - Convert to uppercase\n`$(if:user.bot?Bot:Human)` - Conditional logic\n\n**Format:** `$(if:condition?true:false)`'
-            },
-            {
-                'title': f'{SPROUTS_INFORMATION} Advanced Ticket Variables',
-                'description': 'Specialized variables for ticket system',
-                'content': '`$(ticket.id)` - Ticket\'s unique ID number\n`$(ticket.creator)` - User who created ticket\n`$(ticket.category)` - Ticket category name\n`$(ticket.status)` - Current ticket status\n`$(ticket.staff)` - Staff member assigned\n`$(ticket.claimed)` - Is ticket claimed (Yes/No)\n`$(ticket.tags)` - List of ticket tags\n`$(ticket.panel)` - Panel used to create ticket\n`$(ticket.transcript)` - Transcript download URL'
-            }
-        ]
+        self.pages = _VARIABLE_PAGES
     
     async def create_embed(self, page_num):
         """Create embed for specific page"""
@@ -73,7 +280,7 @@ class VariablesView(discord.ui.View):
         
         embed.add_field(
             name=f"{SPROUTS_INFORMATION} Usage Examples",
-            value="• In embeds: `$(user.name)` → Actual username\n• Mix text: `Welcome $(user.mention) to $(server.name)!`\n• Math: `You rolled $(random:1-6)!`\n• Logic: `$(if:channel.nsfw?NSFW Content:Safe Channel)`",
+            value=_USAGE_EXAMPLES,
             inline=False
         )
         
@@ -81,32 +288,17 @@ class VariablesView(discord.ui.View):
             text=f"Page {page_num + 1}/{len(self.pages)} • Use $(variable.name) syntax",
             icon_url=self.user.display_avatar.url
         )
-        embed.timestamp = discord.utils.utcnow()
+        embed.timestamp = datetime.now(timezone.utc)
         
         return embed
     
-    @discord.ui.button(label='◀ Previous', style=discord.ButtonStyle.blurple, disabled=True)
-    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+    @discord.ui.select(placeholder="Choose a variable category...", options=_VARIABLE_PAGE_OPTIONS)
+    async def page_select(self, interaction: discord.Interaction, select: discord.ui.Select):
         if interaction.user != self.user:
             await interaction.response.send_message("Only the command user can navigate pages.", ephemeral=True)
             return
             
-        self.current_page = max(0, self.current_page - 1)
-        self.children[0].disabled = self.current_page == 0
-        self.children[1].disabled = self.current_page == len(self.pages) - 1
-        
-        embed = await self.create_embed(self.current_page)
-        await interaction.response.edit_message(embed=embed, view=self)
-    
-    @discord.ui.button(label='Next ▶', style=discord.ButtonStyle.blurple)
-    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user != self.user:
-            await interaction.response.send_message("Only the command user can navigate pages.", ephemeral=True)
-            return
-            
-        self.current_page = min(len(self.pages) - 1, self.current_page + 1)
-        self.children[0].disabled = self.current_page == 0
-        self.children[1].disabled = self.current_page == len(self.pages) - 1
+        self.current_page = int(select.values[0])
         
         embed = await self.create_embed(self.current_page)
         await interaction.response.edit_message(embed=embed, view=self)
@@ -129,7 +321,8 @@ Choice: $(choose:Awesome|Cool|Amazing)
 Logic: This user is $(if:user.bot?a bot:human)"""
 
         try:
-            from src.utils.variable_processor import variable_processor
+            if variable_processor is None:
+                raise RuntimeError("variable processor is unavailable")
             variable_processor.bot = self.user.guild.get_member(interaction.client.user.id).bot if self.user.guild else interaction.client
             processed_text = await variable_processor.process_variables(
                 test_text,
@@ -153,172 +346,206 @@ Logic: This user is $(if:user.bot?a bot:human)"""
 class Utilities(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self._bot_mention = None
+        self._dm_prefix_embed = None
+        self._bot_avatar_url = None
+        self._invite_cache = OrderedDict()
+        self._invite_inflight = {}
+        # Static parts of the prefix embed; only the prefix and mention are filled in per call
+        self._prefix_embed_template = {
+            "title": "Current Prefix",
+            "color": EMBED_COLOR_NORMAL,
+            "fields": [{
+                "name": "Usage",
+                "value": "Use `{prefix}help` for commands\n"
+                         "**Note:** You can always mention me {mention} regardless of prefix changes",
+                "inline": False
+            }]
+        }
+        # setprefix error embeds never change; copy the missing-permissions one before adding a footer
+        self._invalid_prefix_embed = discord.Embed(
+            title=f"{SPROUTS_ERROR} Invalid Prefix",
+            description="Prefix must be 1-5 characters and cannot be blank.",
+            color=EMBED_COLOR_ERROR
+        )
+        self._missing_perms_embed = discord.Embed(
+            title=f"{SPROUTS_ERROR} Missing Permissions",
+            description="You need **Administrator** permissions to change the server prefix.",
+            color=EMBED_COLOR_ERROR
+        )
+        # Sent as-is (never mutated) whenever an invite can't be resolved
+        self._invalid_invite_embed = discord.Embed(
+            title=f"{SPROUTS_ERROR} Invalid Invite",
+            description="The invite link is invalid or has expired.",
+            color=EMBED_COLOR_ERROR
+        )
+        # The variables reference is static, so its pages are serialized once
+        self._variables_payloads = self._build_variables_payloads()
+        # Footered pages per requester; bounded so name/avatar changes can't grow it forever
+        self._variables_pages = functools.lru_cache(maxsize=256)(self._render_variables_pages)
+        # Caps concurrent info embed builds so bursts can't crowd out gateway dispatch
+        self._info_sem = asyncio.Semaphore(8)
 
-    @commands.command(name="variables", help="Show all available variables for embeds and messages")
-    @commands.cooldown(1, 10, commands.BucketType.user)
-    async def variables(self, ctx):
-        """Show comprehensive list of available variables for embeds and auto responses
+    @staticmethod
+    def _build_variables_payloads():
+        """Build the static variables pages as embed dicts (footer is added per request)"""
+        # Page 1 - Basic Variables
+        page1 = discord.Embed(
+            title="Available Variables - Basic",
+            description="Use these variables in embeds, auto responders, and ticket messages.\nFormat: `$(variable.name)`",
+            color=EMBED_COLOR_NORMAL
+        )
+        
+        # User Variables
+        page1.add_field(
+            name="User Variables",
+            value=_USER_VARS_BLOCK,
+            inline=False
+        )
+        
+        # Server Variables
+        page1.add_field(
+            name="Server Variables",
+            value=_SERVER_VARS_BLOCK,
+            inline=False
+        )
+        
+        # Channel Variables
+        page1.add_field(
+            name="Channel Variables",
+            value=_CHANNEL_VARS_BASIC_BLOCK,
+            inline=False
+        )
+        
+        # Page 2 - Ticket Variables
+        page2 = discord.Embed(
+            title="Available Variables - Tickets",
+            description="Ticket-specific variables for support systems.\nFormat: `$(variable.name)`",
+            color=EMBED_COLOR_NORMAL
+        )
+        
+        # Ticket Variables
+        page2.add_field(
+            name="Ticket Variables",
+            value=_TICKET_VARS_BASIC_BLOCK,
+            inline=False
+        )
+        
+        return [page1.to_dict(), page2.to_dict()]
 
-        Usage: `{ctx.prefix}variables`
-        Displays all 40+ available variables with descriptions and usage syntax
+    def _render_variables_pages(self, author_name, author_icon):
+        """Apply the requester footer to the static variables pages, returned as embed dicts"""
+        total_pages = len(self._variables_payloads)
+        pages = []
+        for page_num, payload in enumerate(self._variables_payloads, start=1):
+            page = discord.Embed.from_dict(payload)
+            page.set_footer(text=f"Page {page_num}/{total_pages} • Requested by {author_name}", icon_url=author_icon)
+            pages.append(page.to_dict())
+        return tuple(pages)
 
-        Examples:
-        - `{ctx.prefix}variables` - View complete variable reference guide
+    @property
+    def bot_mention(self):
+        """Mention string for the bot user, formatted once after login"""
+        if self._bot_mention is None:
+            self._bot_mention = f"<@{self.bot.user.id}>"
+        return self._bot_mention
 
-        Variable Categories:
-        - User Variables: Display user information like name, avatar, join date
-        - Server Variables: Show server details like name, member count, boosts
-        - Channel Variables: Reference channel data like name, topic, category
-        - Date/Time Variables: Current timestamps and formatted dates
-        - Ticket Variables: Special variables for ticket system integration
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Refresh the cached bot avatar URL whenever the bot (re)connects"""
+        self._bot_avatar_url = self.bot.user.display_avatar.url
 
-        Usage Format:
-        - Wrap variables in `$(variable.name)` syntax
-        - Variables are case-sensitive and must match exactly
-        - Works in embeds, auto-responses, sticky messages, and welcome system
-        - Variables are processed in real-time when content is displayed
+    def _bot_avatar(self):
+        """Bot avatar URL, resolved on demand if on_ready hasn't cached it yet"""
+        if self._bot_avatar_url is None:
+            self._bot_avatar_url = self.bot.user.display_avatar.url
+        return self._bot_avatar_url
 
-        Common Errors:
-        - Invalid syntax: Must use `$(variable.name)` format exactly
-        - Unknown variable: Check spelling and available variable list
-        - Missing context: Some variables only work in specific contexts
-        """
-        try:
-            embed = discord.Embed(
-                title="Available Variables",
-                description="Usage: Wrap variables in `$(variable.name)` syntax\n"
-                           "Example: `$(user.name)` displays the username\n\n"
-                           "Available for: Embeds, Custom Replies, Sticky Messages, Welcome System",
-                color=EMBED_COLOR_NORMAL
-            )
-            
-            # User Variables
-            user_vars = [
-                "`$(user.name)` - User's username",
-                "`$(user.mention)` - Mentions the user",
-                "`$(user.id)` - User's Discord ID",
-                "`$(user.nick)` - User's server nickname",
-                "`$(user.tag)` - Full username with discriminator",
-                "`$(user.avatar)` - User's avatar image URL",
-                "`$(user.joined)` - Date user joined the server",
-                "`$(user.created)` - Date user account was created"
-            ]
-            
-            embed.add_field(
-                name="User Variables",
-                value="\n".join(user_vars),
-                inline=False
-            )
-            
-            # Server Variables
-            server_vars = [
-                "`$(server.name)` - Server name",
-                "`$(server.membercount)` - Total member count",
-                "`$(server.owner)` - Server owner's name",
-                "`$(server.id)` - Server's Discord ID",
-                "`$(server.icon)` - Server icon image URL",
-                "`$(server.created)` - Date server was created",
-                "`$(server.boosts)` - Number of server boosts",
-                "`$(server.channels)` - Total channel count"
-            ]
-            
-            embed.add_field(
-                name="Server Variables",
-                value="\n".join(server_vars),
-                inline=False
-            )
-            
-            # Channel Variables
-            channel_vars = [
-                "`$(channel.name)` - Current channel name",
-                "`$(channel.id)` - Channel's Discord ID",
-                "`$(channel.mention)` - Mentions the current channel", 
-                "`$(channel.topic)` - Channel's topic description",
-                "`$(channel.category)` - Channel's category name",
-                "`$(channel.position)` - Channel's position in list",
-                "`$(channel.created)` - Date channel was created",
-                "`$(channel.nsfw)` - Whether channel is NSFW",
-                "`$(channel.slowmode)` - Channel slowmode delay"
-            ]
-            
-            embed.add_field(
-                name="Channel Variables",
-                value="\n".join(channel_vars),
-                inline=False
-            )
-            
-            # Time Variables  
-            time_vars = [
-                "`$(time)` - Current time",
-                "`$(date)` - Current date",
-                "`$(datetime)` - Current date and time",
-                "`$(year)` - Current year",
-                "`$(month)` - Current month name",
-                "`$(day)` - Current day of month"
-            ]
-            
-            embed.add_field(
-                name="Time Variables",
-                value="\n".join(time_vars),
-                inline=False
-            )
-            
-            # Special Variables
-            special_vars = [
-                "`$(random:1-100)` - Random number between range",
-                "`$(random:word1|word2)` - Random choice from options",
-                "`$(choose:a|b|c)` - Randomly selects from list",
-                "`$(math:5+5)` - Performs basic math calculations"
-            ]
-            
-            embed.add_field(
-                name="Special Variables",
-                value="\n".join(special_vars),
-                inline=False
-            )
-            
-            # Ticket Variables
-            ticket_vars = [
-                "`$(ticket.id)` - Ticket's unique ID number",
-                "`$(ticket.creator)` - User who created ticket",
-                "`$(ticket.category)` - Ticket category name",
-                "`$(ticket.status)` - Current ticket status",
-                "`$(ticket.created)` - Date ticket was created",
-                "`$(ticket.staff)` - Staff member assigned to ticket",
-                "`$(ticket.channel)` - Ticket channel name",
-                "`$(ticket.reason)` - Reason for creating ticket",
-                "`$(ticket.priority)` - Ticket priority level"
+    async def _get_invite_embed(self, invite_code):
+        """Get the invite info embed for a code, serving recent lookups from a small TTL/LRU cache"""
+        now = time.monotonic()
+        cached = self._invite_cache.get(invite_code)
+        if cached and cached[0] > now:
+            self._invite_cache.move_to_end(invite_code)
+            return cached[1]
+        
+        # Concurrent lookups for the same code share one in-flight fetch; shield it so
+        # one caller being cancelled doesn't cancel the request for the others
+        task = self._invite_inflight.get(invite_code)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_invite_embed(invite_code))
+            self._invite_inflight[invite_code] = task
+            task.add_done_callback(lambda _: self._invite_inflight.pop(invite_code, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_invite_embed(self, invite_code):
+        """Fetch an invite, build its embed and store it in the invite cache"""
+        invite = await self.bot.fetch_invite(invite_code, with_counts=True, with_expiration=True)
+        embed = self._build_invite_embed(invite)
+        self._invite_cache[invite_code] = (time.monotonic() + INVITE_CACHE_TTL, embed)
+        self._invite_cache.move_to_end(invite_code)
+        while len(self._invite_cache) > INVITE_CACHE_SIZE:
+            self._invite_cache.popitem(last=False)
+        return embed
+
+    @staticmethod
+    def _build_invite_embed(invite):
+        """Build the invite info embed (without the per-request footer)"""
+        # fetch_invite doesn't return max_age, so expiry comes from expires_at (None means permanent)
+        expire_info = _fmt_dt(_unix(invite.expires_at)) if invite.expires_at else "Never"
+        created_str = _fmt_dt(_unix(invite.created_at)) if invite.created_at else "Unknown"
+        usage_info = "Unlimited" if invite.max_uses == 0 else f"{invite.uses}/{invite.max_uses}"
+        
+        data = {
+            "title": f"Invite Information - {invite.guild.name}",
+            "color": EMBED_COLOR_NORMAL,
+            "fields": [
+                {
+                    "name": "Server Details",
+                    "value": f"**Name:** {invite.guild.name}\n"
+                             f"**ID:** `{invite.guild.id}`\n"
+                             f"**Members:** {invite.approximate_member_count:,}\n"
+                             f"**Online:** {invite.approximate_presence_count:,}",
+                    "inline": True
+                },
+                {
+                    "name": "Invite Details",
+                    "value": f"**Code:** `{invite.code}`\n"
+                             f"**Channel:** #{invite.channel.name}\n"
+                             f"**Inviter:** {invite.inviter.name if invite.inviter else 'Unknown'}\n"
+                             f"**Created:** {created_str}",
+                    "inline": True
+                },
+                {
+                    "name": "Usage & Expiry",
+                    "value": f"**Uses:** {usage_info}\n"
+                             f"**Expires:** {expire_info}\n"
+                             f"**Temporary:** {'Yes' if invite.temporary else 'No'}",
+                    "inline": True
+                }
             ]
-            
-            embed.add_field(
-                name="Ticket Variables", 
-                value="\n".join(ticket_vars),
-                inline=False
-            )
-            
-            embed.set_thumbnail(url=self.bot.user.display_avatar.url)
-            embed.set_footer(
-                text=f"Requested by {ctx.author.display_name}",
-                icon_url=ctx.author.display_avatar.url
-            )
-            embed.timestamp = discord.utils.utcnow()
-            
-            await ctx.reply(embed=embed, mention_author=False)
-            logger.info(f"Variables command used by {ctx.author}")
-            
-        except Exception as e:
-            logger.error(f"Error in variables command: {e}")
-            error_embed = discord.Embed(
-                title=f"{SPROUTS_ERROR} Error",
-                description="An error occurred while fetching variables.",
-                color=EMBED_COLOR_ERROR
-            )
-            error_embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            error_embed.timestamp = discord.utils.utcnow()
-            await ctx.reply(embed=error_embed, mention_author=False)
+        }
+        if invite.guild.icon:
+            data["thumbnail"] = {"url": invite.guild.icon.url}
+        
+        return discord.Embed.from_dict(data)
+
+    def _build_prefix_embed(self, current_prefix):
+        """Fill the prefix embed template for the given prefix"""
+        template = self._prefix_embed_template
+        usage_field = template["fields"][0]
+        return discord.Embed.from_dict({
+            **template,
+            "description": f"The current prefix for this server is: `{current_prefix}`",
+            "fields": [{
+                **usage_field,
+                "value": usage_field["value"].format(prefix=current_prefix, mention=self.bot_mention)
+            }]
+        })
 
     @commands.command(name="ping", help="Check bot response time and API latency")
     @commands.cooldown(1, 5, commands.BucketType.user)
+    @shared_cooldown(5, commands.BucketType.user)
     async def ping(self, ctx):
         """Check bot latency and response time with detailed statistics
 
@@ -334,29 +561,19 @@ class Utilities(commands.Cog):
         - Bot uptime since last restart
         - Memory usage and system stats
         """
+        footer_text, footer_icon = f"Requested by {ctx.author.display_name}", ctx.author.display_avatar.url
         try:
-            import time
-            import psutil
-            
             # Measure response time
             start_time = time.perf_counter()
             temp_message = await ctx.send("Pinging...")
-            
-            # Add delay to calculate ping properly
-            await asyncio.sleep(0.5)
-            
-            end_time = time.perf_counter()
-            response_time = round((end_time - start_time) * 1000)
+            response_time = round((time.perf_counter() - start_time) * 1000)
             
             # Get latencies
             heartbeat = round(self.bot.latency * 1000)
             
-            # Get uptime
-            uptime_seconds = (discord.utils.utcnow() - self.bot.start_time).total_seconds()
-            uptime_hours = int(uptime_seconds // 3600)
-            uptime_minutes = int((uptime_seconds % 3600) // 60)
-            uptime_secs = int(uptime_seconds % 60)
-            uptime_display = f"{uptime_hours:02d}:{uptime_minutes:02d}:{uptime_secs:02d}"
+            # Get uptime (timedelta renders as H:MM:SS, with a day count past 24h)
+            uptime = datetime.now(timezone.utc) - self.bot.start_time
+            uptime_display = str(timedelta(seconds=int(uptime.total_seconds())))
             
             embed = discord.Embed(
                 title="🏓 Pong!",
@@ -375,25 +592,26 @@ class Utilities(commands.Cog):
             )
             
             
-            embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            embed.timestamp = discord.utils.utcnow()
+            embed.set_footer(text=footer_text, icon_url=footer_icon)
+            embed.timestamp = datetime.now(timezone.utc)
             
             await temp_message.edit(content=None, embed=embed)
-            logger.info(f"Ping command used by {ctx.author}")
+            logger.info("Ping command used by %s", ctx.author)
             
-        except Exception as e:
+        except (discord.HTTPException, ValueError, KeyError) as e:
             logger.error(f"Error in ping command: {e}")
             error_embed = discord.Embed(
                 title=f"{SPROUTS_ERROR} Ping Error",
                 description="An error occurred while checking latency.",
                 color=EMBED_COLOR_ERROR
             )
-            error_embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            error_embed.timestamp = discord.utils.utcnow()
+            error_embed.set_footer(text=footer_text, icon_url=footer_icon)
+            error_embed.timestamp = datetime.now(timezone.utc)
             await ctx.reply(embed=error_embed, mention_author=False)
 
     @commands.command(name="avatar", help="Get user's avatar (defaults to yourself)")
     @commands.cooldown(1, 5, commands.BucketType.user)
+    @shared_cooldown(5, commands.BucketType.user)
     async def avatar(self, ctx, member: discord.Member = None):
         """Display user's avatar in high resolution
 
@@ -411,37 +629,40 @@ class Utilities(commands.Cog):
         - Shows both server and global avatars if different
         - Animated GIF support for Nitro users
         """
+        footer_text, footer_icon = f"Requested by {ctx.author.display_name}", ctx.author.display_avatar.url
         try:
             target = member or ctx.author
             embed = discord.Embed(
                 title=f"{target.display_name}'s Avatar",
                 color=EMBED_COLOR_NORMAL
             )
-            embed.set_image(url=target.display_avatar.url)
+            avatar = target.display_avatar
+            embed.set_image(url=avatar.url)
             embed.add_field(
                 name="Download Links",
-                value=f"[PNG]({target.display_avatar.with_format('png').url}) | "
-                      f"[JPG]({target.display_avatar.with_format('jpg').url}) | "
-                      f"[WEBP]({target.display_avatar.with_format('webp').url})",
+                value=f"[PNG]({avatar.with_format('png').url}) | "
+                      f"[JPG]({avatar.with_format('jpg').url}) | "
+                      f"[WEBP]({avatar.with_format('webp').url})",
                 inline=False
             )
-            embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            embed.timestamp = discord.utils.utcnow()
+            embed.set_footer(text=footer_text, icon_url=footer_icon)
+            embed.timestamp = datetime.now(timezone.utc)
             await ctx.reply(embed=embed, mention_author=False)
-            logger.info(f"Avatar command used by {ctx.author}")
-        except Exception as e:
+            logger.info("Avatar command used by %s", ctx.author)
+        except (discord.HTTPException, ValueError, KeyError) as e:
             logger.error(f"Error in avatar command: {e}")
             error_embed = discord.Embed(
                 title=f"{SPROUTS_ERROR} Avatar Error",
                 description="An error occurred while fetching avatar.",
                 color=EMBED_COLOR_ERROR
             )
-            error_embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            error_embed.timestamp = discord.utils.utcnow()
+            error_embed.set_footer(text=footer_text, icon_url=footer_icon)
+            error_embed.timestamp = datetime.now(timezone.utc)
             await ctx.reply(embed=error_embed, mention_author=False)
 
     @commands.command(name="userinfo", help="Get detailed user information (defaults to yourself)")
     @commands.cooldown(1, 10, commands.BucketType.user)
+    @shared_cooldown(10, commands.BucketType.user)
     async def userinfo(self, ctx, member: discord.Member = None):
         """Display detailed user information
 
@@ -459,116 +680,73 @@ class Utilities(commands.Cog):
         - Avatar and presence status
         - Boost status and acknowledgments
         """
-        try:
-            target = member or ctx.author
-            
-            embed = discord.Embed(
-                title=f"User Information - {target.display_name}",
-                color=target.color if target.color != discord.Color.default() else EMBED_COLOR_NORMAL
-            )
-            
-            # Basic info
-            embed.add_field(
-                name="User Details",
-                value=f"**Username:** {target.name}\n"
-                      f"**Display Name:** {target.display_name}\n"
-                      f"**ID:** `{target.id}`\n"
-                      f"**Bot:** {'Yes' if target.bot else 'No'}",
-                inline=True
-            )
-            
-            # Server info
-            if target.joined_at:
-                embed.add_field(
-                    name="Server Info",
-                    value=f"**Joined:** <t:{int(target.joined_at.timestamp())}:F>\n"
-                          f"**Nickname:** {target.nick or 'None'}\n"
-                          f"**Top Role:** {target.top_role.name}",
-                    inline=True
+        footer_text, footer_icon = f"Requested by {ctx.author.display_name}", ctx.author.display_avatar.url
+        async with self._info_sem:
+            try:
+                target = member or ctx.author
+            
+                # User, server and account details share one description instead of three fields
+                sections = [
+                    f"**User Details**\n"
+                    f"**Username:** {target.name}\n"
+                    f"**Display Name:** {target.display_name}\n"
+                    f"**ID:** `{target.id}`\n"
+                    f"**Bot:** {'Yes' if target.bot else 'No'}"
+                ]
+                if target.joined_at:
+                    sections.append(
+                        f"**Server Info**\n"
+                        f"**Joined:** {_fmt_dt(_unix(target.joined_at))}\n"
+                        f"**Nickname:** {target.nick or 'None'}\n"
+                        f"**Top Role:** {target.top_role.name}"
+                    )
+                sections.append(
+                    f"**Account Info**\n"
+                    f"**Created:** {_fmt_dt(_snowflake_ts(target.id))}\n"
+                    f"**Status:** {_STATUS_TEXT.get(target.status, 'Unknown')}\n"
+                    f"**Activity:** {_activity_text(target)}"
                 )
             
-            # Account info with proper presence - text-based status for SPROUTS consistency
-            status_text = {
-                discord.Status.online: "Online",
-                discord.Status.idle: "Away", 
-                discord.Status.dnd: "Do Not Disturb",
-                discord.Status.offline: "Offline",
-                discord.Status.invisible: "Offline"  # Discord shows invisible as offline
-            }
-            
-            # Get user activity with improved detection
-            activity_text = "None"
-            if target.activities:
-                for activity in target.activities:
-                    if activity.type == discord.ActivityType.playing:
-                        activity_text = f"Playing {activity.name}"
-                        break
-                    elif activity.type == discord.ActivityType.listening:
-                        if hasattr(activity, 'title') and hasattr(activity, 'artist'):
-                            activity_text = f"Listening to {activity.title} by {activity.artist}"
-                        else:
-                            activity_text = f"Listening to {activity.name}"
-                        break
-                    elif activity.type == discord.ActivityType.watching:
-                        activity_text = f"Watching {activity.name}"
-                        break
-                    elif activity.type == discord.ActivityType.streaming:
-                        activity_text = f"Streaming {activity.name}"
-                        break
-                    elif activity.type == discord.ActivityType.custom and activity.name:
-                        activity_text = f"{activity.name}"
-                        break
-            
-            # Also check presence for rich presence activities
-            if activity_text == "None" and hasattr(target, 'activity') and target.activity:
-                if target.activity.type == discord.ActivityType.playing:
-                    activity_text = f"Playing {target.activity.name}"
-                elif target.activity.type == discord.ActivityType.listening:
-                    activity_text = f"Listening to {target.activity.name}"
-                elif target.activity.type == discord.ActivityType.watching:
-                    activity_text = f"Watching {target.activity.name}"
-                elif target.activity.type == discord.ActivityType.streaming:
-                    activity_text = f"Streaming {target.activity.name}"
-            
-            embed.add_field(
-                name="Account Info",
-                value=f"**Created:** <t:{int(target.created_at.timestamp())}:F>\n"
-                      f"**Status:** {status_text.get(target.status, 'Unknown')}\n"
-                      f"**Activity:** {activity_text}",
-                inline=True
-            )
-            
-            # Role list (max 10) - properly display roles
-            roles = [role.mention for role in target.roles[1:]]  # Skip @everyone, use mentions
-            if roles:
-                role_list = ", ".join(roles[:10])
-                if len(roles) > 10:
-                    role_list += f" +{len(roles) - 10} more"
-                embed.add_field(
-                    name=f"Roles ({len(roles)})",
-                    value=role_list,
-                    inline=False
+                embed = discord.Embed(
+                    title=f"User Information - {target.display_name}",
+                    description="\n\n".join(sections),
+                    color=target.color if target.color != discord.Color.default() else EMBED_COLOR_NORMAL
                 )
             
-            embed.set_thumbnail(url=target.display_avatar.url)
-            embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            embed.timestamp = discord.utils.utcnow()
+                # Role list (max 10) - only the shown mentions are built, skipping @everyone;
+                # Member.roles sorts on every access, so it is read once
+                member_roles = target.roles
+                total_roles = len(member_roles) - 1
+                if total_roles > 0:
+                    role_list = ", ".join(role.mention for role in itertools.islice(member_roles, 1, 11))
+                    if total_roles > 10:
+                        role_list += f" +{total_roles - 10} more"
+                    embed.add_field(
+                        name=f"Roles ({total_roles})",
+                        value=role_list,
+                        inline=False
+                    )
+            
+                embed.set_thumbnail(url=target.display_avatar.url)
+                embed.set_footer(text=footer_text, icon_url=footer_icon)
+                embed.timestamp = datetime.now(timezone.utc)
             
-            await ctx.reply(embed=embed, mention_author=False)
-            logger.info(f"Userinfo command used by {ctx.author}")
-        except Exception as e:
-            logger.error(f"Error in userinfo command: {e}")
-            error_embed = discord.Embed(
-                title=f"{SPROUTS_ERROR} User Info Error",
-                description="An error occurred while fetching user information.",
-                color=EMBED_COLOR_ERROR
-            )
-            error_embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            error_embed.timestamp = discord.utils.utcnow()
-            await ctx.reply(embed=error_embed, mention_author=False)
+                await ctx.reply(embed=embed, mention_author=False)
+                logger.info("Userinfo command used by %s", ctx.author)
+            except (discord.HTTPException, ValueError, KeyError) as e:
+                logger.error(f"Error in userinfo command: {e}")
+                error_embed = discord.Embed(
+                    title=f"{SPROUTS_ERROR} User Info Error",
+                    description="An error occurred while fetching user information.",
+                    color=EMBED_COLOR_ERROR
+                )
+                error_embed.set_footer(text=footer_text, icon_url=footer_icon)
+                error_embed.timestamp = datetime.now(timezone.utc)
+                await ctx.reply(embed=error_embed, mention_author=False)
 
     @commands.command(name="serverinfo", help="Get detailed server information and statistics")
     @commands.cooldown(1, 10, commands.BucketType.user)
+    @shared_cooldown(10, commands.BucketType.user)
     async def serverinfo(self, ctx):
         """Display comprehensive server information
 
@@ -585,95 +763,105 @@ class Utilities(commands.Cog):
         - Channel counts by type
         - Role information and permissions
         """
-        try:
-            guild = ctx.guild
-            if not guild:
-                await ctx.reply("This command can only be used in a server.", mention_author=False)
-                return
-            
-            embed = discord.Embed(
-                title=f"Server Information - {guild.name}",
-                color=EMBED_COLOR_NORMAL
-            )
+        footer_text, footer_icon = f"Requested by {ctx.author.display_name}", ctx.author.display_avatar.url
+        async with self._info_sem:
+            try:
+                guild = ctx.guild
+                if not guild:
+                    await ctx.reply("This command can only be used in a server.", mention_author=False)
+                    return
             
-            # Basic info
-            embed.add_field(
-                name="Server Details",
-                value=f"**Name:** {guild.name}\n"
-                      f"**ID:** `{guild.id}`\n"
-                      f"**Owner:** {guild.owner.mention if guild.owner else 'Unknown'}\n"
-                      f"**Created:** <t:{int(guild.created_at.timestamp())}:F>",
-                inline=True
-            )
+                embed = discord.Embed(
+                    title=f"Server Information - {guild.name}",
+                    color=EMBED_COLOR_NORMAL
+                )
             
-            # Member info
-            embed.add_field(
-                name="Members",
-                value=f"**Total:** {guild.member_count:,}\n"
-                      f"**Verification:** {guild.verification_level.name.title()}\n"
-                      f"**Boost Tier:** {guild.premium_tier}\n"
-                      f"**Boosts:** {guild.premium_subscription_count or 0}",
-                inline=True
-            )
+                # Basic info
+                embed.add_field(
+                    name="Server Details",
+                    value=f"**Name:** {guild.name}\n"
+                          f"**ID:** `{guild.id}`\n"
+                          f"**Owner:** {guild.owner.mention if guild.owner else 'Unknown'}\n"
+                          f"**Created:** {_fmt_dt(_snowflake_ts(guild.id))}",
+                    inline=True
+                )
             
-            # Channel counts
-            text_channels = len(guild.text_channels)
-            voice_channels = len(guild.voice_channels)
-            categories = len(guild.categories)
+                # Member info
+                embed.add_field(
+                    name="Members",
+                    value=f"**Total:** {guild.member_count:,}\n"
+                          f"**Verification:** {guild.verification_level.name.title()}\n"
+                          f"**Boost Tier:** {guild.premium_tier}\n"
+                          f"**Boosts:** {guild.premium_subscription_count or 0}",
+                    inline=True
+                )
             
-            embed.add_field(
-                name="Channels",
-                value=f"**Text:** {text_channels}\n"
-                      f"**Voice:** {voice_channels}\n"
-                      f"**Categories:** {categories}\n"
-                      f"**Total:** {len(guild.channels)}",
-                inline=True
-            )
+                # Channel counts in one pass (the per-type guild properties each filter and sort)
+                text_channels = voice_channels = categories = total_channels = 0
+                for channel in guild.channels:
+                    total_channels += 1
+                    if isinstance(channel, discord.TextChannel):
+                        text_channels += 1
+                    elif isinstance(channel, discord.VoiceChannel):
+                        voice_channels += 1
+                    elif isinstance(channel, discord.CategoryChannel):
+                        categories += 1
             
-            # Role and emoji counts
-            embed.add_field(
-                name="Other",
-                value=f"**Roles:** {len(guild.roles)}\n"
-                      f"**Emojis:** {len(guild.emojis)}\n"
-                      f"**Features:** {len(guild.features)}",
-                inline=True
-            )
-            
-            # Features
-            if guild.features:
-                features = ", ".join([feature.replace("_", " ").title() for feature in guild.features[:5]])
-                if len(guild.features) > 5:
-                    features += f" +{len(guild.features) - 5} more"
                 embed.add_field(
-                    name="Features",
-                    value=features,
-                    inline=False
+                    name="Channels",
+                    value=f"**Text:** {text_channels}\n"
+                          f"**Voice:** {voice_channels}\n"
+                          f"**Categories:** {categories}\n"
+                          f"**Total:** {total_channels}",
+                    inline=True
                 )
             
-            # Set server icon as thumbnail, fallback to bot avatar if no icon
-            if guild.icon:
-                embed.set_thumbnail(url=guild.icon.url)
-            else:
-                embed.set_thumbnail(url=self.bot.user.display_avatar.url)
+                # Role and emoji counts
+                embed.add_field(
+                    name="Other",
+                    value=f"**Roles:** {len(guild.roles)}\n"
+                          f"**Emojis:** {len(guild.emojis)}\n"
+                          f"**Features:** {len(guild.features)}",
+                    inline=True
+                )
             
-            embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            embed.timestamp = discord.utils.utcnow()
+                # Features
+                if guild.features:
+                    features = ", ".join(_pretty_feature(feature) for feature in guild.features[:5])
+                    if len(guild.features) > 5:
+                        features += f" +{len(guild.features) - 5} more"
+                    embed.add_field(
+                        name="Features",
+                        value=features,
+                        inline=False
+                    )
+            
+                # Set server icon as thumbnail, fallback to bot avatar if no icon
+                if guild.icon:
+                    embed.set_thumbnail(url=guild.icon.url)
+                else:
+                    embed.set_thumbnail(url=self._bot_avatar())
+            
+                embed.set_footer(text=footer_text, icon_url=footer_icon)
+                embed.timestamp = datetime.now(timezone.utc)
             
-            await ctx.reply(embed=embed, mention_author=False)
-            logger.info(f"Serverinfo command used by {ctx.author}")
-        except Exception as e:
-            logger.error(f"Error in serverinfo command: {e}")
-            error_embed = discord.Embed(
-                title=f"{SPROUTS_ERROR} Server Info Error",
-                description="An error occurred while fetching server information.",
-                color=EMBED_COLOR_ERROR
-            )
-            error_embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            error_embed.timestamp = discord.utils.utcnow()
-            await ctx.reply(embed=error_embed, mention_author=False)
+                await ctx.reply(embed=embed, mention_author=False)
+                logger.info("Serverinfo command used by %s", ctx.author)
+            except (discord.HTTPException, ValueError, KeyError) as e:
+                logger.error(f"Error in serverinfo command: {e}")
+                error_embed = discord.Embed(
+                    title=f"{SPROUTS_ERROR} Server Info Error",
+                    description="An error occurred while fetching server information.",
+                    color=EMBED_COLOR_ERROR
+                )
+                error_embed.set_footer(text=footer_text, icon_url=footer_icon)
+                error_embed.timestamp = datetime.now(timezone.utc)
+                await ctx.reply(embed=error_embed, mention_author=False)
 
     @commands.command(name="channelinfo", help="Get detailed channel information")
     @commands.cooldown(1, 10, commands.BucketType.user)
+    @shared_cooldown(10, commands.BucketType.user)
+    @_reply_on_error("fetching channel information")
     async def channelinfo(self, ctx, channel: discord.TextChannel = None):
         """Display detailed channel information
 
@@ -691,53 +879,46 @@ class Utilities(commands.Cog):
         - Topic, slowmode, and special settings
         - Member access and restriction details
         """
-        try:
-            target_channel = channel or ctx.channel
+        target_channel = channel or ctx.channel
             
-            embed = discord.Embed(
-                title=f"Channel Information - #{target_channel.name}",
-                color=EMBED_COLOR_NORMAL
-            )
+        embed = discord.Embed(
+            title=f"Channel Information - #{target_channel.name}",
+            color=EMBED_COLOR_NORMAL
+        )
             
-            # Basic info
-            embed.add_field(
-                name="Channel Details",
-                value=f"**Name:** {target_channel.name}\n"
-                      f"**ID:** `{target_channel.id}`\n"
-                      f"**Type:** {str(target_channel.type).title()}\n"
-                      f"**Created:** <t:{int(target_channel.created_at.timestamp())}:F>",
-                inline=True
-            )
+        # Basic info and channel settings share one field
+        embed.add_field(
+            name="Channel Details",
+            value=f"**Name:** {target_channel.name}\n"
+                  f"**ID:** `{target_channel.id}`\n"
+                  f"**Type:** {str(target_channel.type).title()}\n"
+                  f"**Created:** {_fmt_dt(_snowflake_ts(target_channel.id))}\n\n"
+                  f"**Settings**\n"
+                  f"**Category:** {target_channel.category.name if target_channel.category else 'None'}\n"
+                  f"**Position:** {target_channel.position}\n"
+                  f"**NSFW:** {'Yes' if target_channel.nsfw else 'No'}\n"
+                  f"**Slowmode:** {target_channel.slowmode_delay}s",
+            inline=False
+        )
             
-            # Channel settings
+        # Topic
+        if target_channel.topic:
             embed.add_field(
-                name="Settings",
-                value=f"**Category:** {target_channel.category.name if target_channel.category else 'None'}\n"
-                      f"**Position:** {target_channel.position}\n"
-                      f"**NSFW:** {'Yes' if target_channel.nsfw else 'No'}\n"
-                      f"**Slowmode:** {target_channel.slowmode_delay}s",
-                inline=True
+                name="Topic",
+                value=target_channel.topic[:1024],
+                inline=False
             )
             
-            # Topic
-            if target_channel.topic:
-                embed.add_field(
-                    name="Topic",
-                    value=target_channel.topic[:1024],
-                    inline=False
-                )
+        embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
+        embed.timestamp = datetime.now(timezone.utc)
             
-            embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            embed.timestamp = discord.utils.utcnow()
-            
-            await ctx.reply(embed=embed, mention_author=False)
-            logger.info(f"Channelinfo command used by {ctx.author}")
-        except Exception as e:
-            logger.error(f"Error in channelinfo command: {e}")
-            await ctx.reply("An error occurred while fetching channel information.", mention_author=False)
+        await ctx.reply(embed=embed, mention_author=False)
+        logger.info("Channelinfo command used by %s", ctx.author)
 
     @commands.command(name="roleinfo", help="Get detailed role information and permissions")
     @commands.cooldown(1, 10, commands.BucketType.user)
+    @shared_cooldown(10, commands.BucketType.user)
+    @_reply_on_error("fetching role information")
     async def roleinfo(self, ctx, *, role: discord.Role):
         """Display detailed role information
 
@@ -755,65 +936,53 @@ class Utilities(commands.Cog):
         - Creation date and mentionable status
         - Integration and bot role information
         """
-        try:
-            embed = discord.Embed(
-                title=f"Role Information - {role.name}",
-                color=role.color if role.color != discord.Color.default() else EMBED_COLOR_NORMAL
-            )
-            
-            # Basic info
-            embed.add_field(
-                name="Role Details",
-                value=f"**Name:** {role.name}\n"
-                      f"**ID:** `{role.id}`\n"
-                      f"**Color:** {str(role.color)}\n"
-                      f"**Created:** <t:{int(role.created_at.timestamp())}:F>",
-                inline=True
-            )
+        embed = discord.Embed(
+            title=f"Role Information - {role.name}",
+            color=role.color if role.color != discord.Color.default() else EMBED_COLOR_NORMAL
+        )
             
-            # Role settings
-            embed.add_field(
-                name="Settings",
-                value=f"**Position:** {role.position}\n"
-                      f"**Mentionable:** {'Yes' if role.mentionable else 'No'}\n"
-                      f"**Hoisted:** {'Yes' if role.hoist else 'No'}\n"
-                      f"**Members:** {len(role.members)}",
-                inline=True
-            )
+        # Basic info and role settings share one field
+        embed.add_field(
+            name="Role Details",
+            value=f"**Name:** {role.name}\n"
+                  f"**ID:** `{role.id}`\n"
+                  f"**Color:** {role.color}\n"
+                  f"**Created:** {_fmt_dt(_snowflake_ts(role.id))}\n\n"
+                  f"**Settings**\n"
+                  f"**Position:** {role.position}\n"
+                  f"**Mentionable:** {'Yes' if role.mentionable else 'No'}\n"
+                  f"**Hoisted:** {'Yes' if role.hoist else 'No'}\n"
+                  f"**Members:** {len(role.members)}",
+            inline=False
+        )
             
-            # Permissions
-            if role.permissions.administrator:
-                perms = "Administrator (All Permissions)"
-            else:
-                important_perms = []
-                if role.permissions.manage_guild: important_perms.append("Manage Server")
-                if role.permissions.manage_channels: important_perms.append("Manage Channels")
-                if role.permissions.manage_roles: important_perms.append("Manage Roles")
-                if role.permissions.manage_messages: important_perms.append("Manage Messages")
-                if role.permissions.kick_members: important_perms.append("Kick Members")
-                if role.permissions.ban_members: important_perms.append("Ban Members")
+        # Permissions, checked as bits of the raw permission value
+        perm_bits = role.permissions.value
+        if perm_bits & _ADMINISTRATOR_BIT:
+            perms = "Administrator (All Permissions)"
+        else:
+            important_perms = [label for bit, label in _KEY_PERM_BITS if perm_bits & bit]
                 
-                perms = ", ".join(important_perms[:5]) if important_perms else "Standard permissions"
-                if len(important_perms) > 5:
-                    perms += f" +{len(important_perms) - 5} more"
+            perms = ", ".join(important_perms[:5]) if important_perms else "Standard permissions"
+            if len(important_perms) > 5:
+                perms += f" +{len(important_perms) - 5} more"
             
-            embed.add_field(
-                name="Key Permissions",
-                value=perms,
-                inline=False
-            )
+        embed.add_field(
+            name="Key Permissions",
+            value=perms,
+            inline=False
+        )
             
-            embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            embed.timestamp = discord.utils.utcnow()
+        embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
+        embed.timestamp = datetime.now(timezone.utc)
             
-            await ctx.reply(embed=embed, mention_author=False)
-            logger.info(f"Roleinfo command used by {ctx.author}")
-        except Exception as e:
-            logger.error(f"Error in roleinfo command: {e}")
-            await ctx.reply("An error occurred while fetching role information.", mention_author=False)
+        await ctx.reply(embed=embed, mention_author=False)
+        logger.info("Roleinfo command used by %s", ctx.author)
 
     @commands.command(name="inviteinfo", help="Get information about Discord invite")
     @commands.cooldown(1, 10, commands.BucketType.user)
+    @shared_cooldown(10, commands.BucketType.user)
+    @_reply_on_error("fetching invite information")
     async def inviteinfo(self, ctx, invite_url: str):
         """Display information about Discord invite link
 
@@ -830,73 +999,30 @@ class Utilities(commands.Cog):
         - Invite creator and expiration
         - Channel destination and features
         """
-        try:
-            # Extract invite code from URL
-            invite_code = invite_url.split('/')[-1]
+        # Extract invite code from URL; malformed input is rejected without an API call
+        match = _INVITE_RE.fullmatch(invite_url.strip())
             
+        embed = None
+        if match:
             try:
-                invite = await self.bot.fetch_invite(invite_code)
+                embed = (await self._get_invite_embed(match.group(1))).copy()
             except discord.NotFound:
-                embed = discord.Embed(
-                    title=f"{SPROUTS_ERROR} Invalid Invite",
-                    description="The invite link is invalid or has expired.",
-                    color=EMBED_COLOR_ERROR
-                )
-                await ctx.reply(embed=embed, mention_author=False)
-                return
-            
-            embed = discord.Embed(
-                title=f"Invite Information - {invite.guild.name}",
-                color=EMBED_COLOR_NORMAL
-            )
-            
-            # Server info
-            embed.add_field(
-                name="Server Details",
-                value=f"**Name:** {invite.guild.name}\n"
-                      f"**ID:** `{invite.guild.id}`\n"
-                      f"**Members:** {invite.approximate_member_count:,}\n"
-                      f"**Online:** {invite.approximate_presence_count:,}",
-                inline=True
-            )
-            
-            # Invite info
-            embed.add_field(
-                name="Invite Details",
-                value=f"**Code:** `{invite.code}`\n"
-                      f"**Channel:** #{invite.channel.name}\n"
-                      f"**Inviter:** {invite.inviter.name if invite.inviter else 'Unknown'}\n"
-                      f"**Created:** <t:{int(invite.created_at.timestamp())}:F>" if invite.created_at else "**Created:** Unknown",
-                inline=True
-            )
-            
-            # Expiry and usage
-            expire_info = "Never" if invite.max_age == 0 else f"<t:{int((invite.created_at.timestamp() + invite.max_age))}:F>" if invite.created_at else "Unknown"
-            usage_info = "Unlimited" if invite.max_uses == 0 else f"{invite.uses}/{invite.max_uses}"
+                pass
             
-            embed.add_field(
-                name="Usage & Expiry",
-                value=f"**Uses:** {usage_info}\n"
-                      f"**Expires:** {expire_info}\n"
-                      f"**Temporary:** {'Yes' if invite.temporary else 'No'}",
-                inline=True
-            )
-            
-            if invite.guild.icon:
-                embed.set_thumbnail(url=invite.guild.icon.url)
+        if embed is None:
+            await ctx.reply(embed=self._invalid_invite_embed, mention_author=False)
+            return
             
-            embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            embed.timestamp = discord.utils.utcnow()
+        embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
             
-            await ctx.reply(embed=embed, mention_author=False)
-            logger.info(f"Inviteinfo command used by {ctx.author}")
-        except Exception as e:
-            logger.error(f"Error in inviteinfo command: {e}")
-            await ctx.reply("An error occurred while fetching invite information.", mention_author=False)
+        await ctx.reply(embed=embed, mention_author=False)
+        logger.info("Inviteinfo command used by %s", ctx.author)
 
     @commands.command(name="setprefix", help="Set custom command prefix for this server")
     @commands.has_permissions(administrator=True)
     @commands.cooldown(1, 10, commands.BucketType.guild)
+    @shared_cooldown(10, commands.BucketType.guild)
+    @_reply_on_error("setting prefix")
     async def setprefix(self, ctx, *, new_prefix: str):
         """Set a custom prefix for this server
 
@@ -909,57 +1035,44 @@ class Utilities(commands.Cog):
         - `{ctx.prefix}setprefix bot.` - Sets prefix to bot.
 
         Common Errors:
-        - Prefix too long: Must be 5 characters or less
+        - Invalid prefix: Must be 1-5 characters and not blank
         - Administrator only: Requires Administrator permission
         - Invalid characters: Some special characters may not work
         """
-        try:
-            if len(new_prefix) > 5:
-                embed = discord.Embed(
-                    title=f"{SPROUTS_ERROR} Prefix Too Long",
-                    description="Prefix must be 5 characters or less.",
-                    color=EMBED_COLOR_ERROR
-                )
-                await ctx.reply(embed=embed, mention_author=False)
-                return
-            
-            from src.cogs.guild_settings import guild_settings
-            old_prefix = guild_settings.get_prefix(ctx.guild.id)
-            guild_settings.set_prefix(ctx.guild.id, new_prefix)
-            
-            embed = discord.Embed(
-                title=f"{SPROUTS_CHECK} Prefix Updated",
-                description=f"Server prefix changed from `{old_prefix}` to `{new_prefix}`",
-                color=EMBED_COLOR_NORMAL
-            )
-            embed.add_field(
-                name="Usage",
-                value=f"You can now use `{new_prefix}help` or mention me <@{self.bot.user.id}>",
-                inline=False
-            )
-            embed.set_footer(text=f"Changed by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            embed.timestamp = discord.utils.utcnow()
+        if not new_prefix.strip() or len(new_prefix) > 5:
+            await ctx.reply(embed=self._invalid_prefix_embed, mention_author=False)
+            return
             
-            await ctx.reply(embed=embed, mention_author=False)
-            logger.info(f"Prefix changed in {ctx.guild.name} from {old_prefix} to {new_prefix}")
-        except Exception as e:
-            logger.error(f"Error in setprefix command: {e}")
-            await ctx.reply("An error occurred while setting prefix.", mention_author=False)
-    
+        old_prefix = guild_settings.get_prefix(ctx.guild.id)
+        guild_settings.set_prefix(ctx.guild.id, new_prefix)
+            
+        embed = discord.Embed.from_dict({
+            "title": f"{SPROUTS_CHECK} Prefix Updated",
+            "description": f"Server prefix changed from `{old_prefix}` to `{new_prefix}`",
+            "color": EMBED_COLOR_NORMAL,
+            "fields": [{
+                "name": "Usage",
+                "value": f"You can now use `{new_prefix}help` or mention me {self.bot_mention}",
+                "inline": False
+            }]
+        })
+        embed.set_footer(text=f"Changed by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
+            
+        await ctx.send(embed=embed)
+        logger.info("Prefix changed in %s from %s to %s", ctx.guild.name, old_prefix, new_prefix)
+
     @setprefix.error
     async def setprefix_error(self, ctx, error):
         """Handle setprefix command errors"""
         if isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                title=f"{SPROUTS_ERROR} Missing Permissions",
-                description="You need **Administrator** permissions to change the server prefix.",
-                color=EMBED_COLOR_ERROR
-            )
+            embed = self._missing_perms_embed.copy()
             embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
             await ctx.reply(embed=embed, mention_author=False)
 
     @commands.command(name="prefix", help="Show current server prefix")
     @commands.cooldown(1, 5, commands.BucketType.user)
+    @shared_cooldown(5, commands.BucketType.user)
+    @_reply_on_error("fetching prefix")
     async def prefix(self, ctx):
         """Show the current server prefix
 
@@ -974,121 +1087,36 @@ class Utilities(commands.Cog):
         - Use setprefix command to change (Administrator only)
         - Each server can have different prefix
         """
-        try:
-            from src.cogs.guild_settings import guild_settings
-            current_prefix = guild_settings.get_prefix(ctx.guild.id) if ctx.guild else 's.'
+        if ctx.guild is None:
+            # DMs always use the default prefix, so one shared embed serves every request
+            if self._dm_prefix_embed is None:
+                self._dm_prefix_embed = self._build_prefix_embed('s.')
+            await ctx.send(embed=self._dm_prefix_embed)
+            return
             
-            embed = discord.Embed(
-                title="Current Prefix",
-                description=f"The current prefix for this server is: `{current_prefix}`",
-                color=EMBED_COLOR_NORMAL
-            )
-            embed.add_field(
-                name="Usage",
-                value=f"Use `{current_prefix}help` for commands\n"
-                      f"**Note:** You can always mention me <@{self.bot.user.id}> regardless of prefix changes",
-                inline=False
-            )
-            embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            embed.timestamp = discord.utils.utcnow()
+        embed = self._build_prefix_embed(guild_settings.get_prefix(ctx.guild.id))
+        embed.set_footer(text=f"Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
             
-            await ctx.reply(embed=embed, mention_author=False)
-        except Exception as e:
-            logger.error(f"Error in prefix command: {e}")
-            await ctx.reply("An error occurred while fetching prefix.", mention_author=False)
+        await ctx.send(embed=embed)
 
     @commands.command(name="variables", help="Display all available embed variables with interactive pagination")
     @commands.cooldown(1, 10, commands.BucketType.user)
+    @shared_cooldown(10, commands.BucketType.user)
+    @_reply_on_error("showing variables")
     async def variables(self, ctx):
         """Show all available embed variables with interactive pagination"""
-        try:
+        async with self._info_sem:
             pages = []
-            
-            # Page 1 - Basic Variables
-            page1 = discord.Embed(
-                title="Available Variables - Basic",
-                description="Use these variables in embeds, auto responders, and ticket messages.\nFormat: `$(variable.name)`",
-                color=EMBED_COLOR_NORMAL
-            )
-            
-            # User Variables
-            page1.add_field(
-                name="User Variables",
-                value="`$(user.name)` - User's username\n"
-                      "`$(user.mention)` - Mentions the user\n"
-                      "`$(user.id)` - User's Discord ID\n"
-                      "`$(user.nick)` - User's server nickname\n"
-                      "`$(user.tag)` - Full username with discriminator\n"
-                      "`$(user.avatar)` - User's avatar image URL\n"
-                      "`$(user.joined)` - Date user joined the server\n"
-                      "`$(user.created)` - Date user account was created",
-                inline=False
-            )
-            
-            # Server Variables
-            page1.add_field(
-                name="Server Variables",
-                value="`$(server.name)` - Server name\n"
-                      "`$(server.membercount)` - Total member count\n"
-                      "`$(server.owner)` - Server owner's name\n"
-                      "`$(server.id)` - Server's Discord ID\n"
-                      "`$(server.icon)` - Server icon image URL\n"
-                      "`$(server.created)` - Date server was created\n"
-                      "`$(server.boosts)` - Number of server boosts\n"
-                      "`$(server.channels)` - Total channel count",
-                inline=False
-            )
-            
-            # Channel Variables
-            page1.add_field(
-                name="Channel Variables",
-                value="`$(channel.name)` - Current channel name\n"
-                      "`$(channel.id)` - Channel's Discord ID\n"
-                      "`$(channel.mention)` - Mentions the current channel\n"
-                      "`$(channel.topic)` - Channel's topic description\n"
-                      "`$(channel.category)` - Channel's category name\n"
-                      "`$(channel.position)` - Channel's position in list",
-                inline=False
-            )
-            
-            page1.set_footer(text=f"Page 1/2 • Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            page1.timestamp = discord.utils.utcnow()
-            pages.append(page1)
-            
-            # Page 2 - Ticket Variables
-            page2 = discord.Embed(
-                title="Available Variables - Tickets",
-                description="Ticket-specific variables for support systems.\nFormat: `$(variable.name)`",
-                color=EMBED_COLOR_NORMAL
-            )
-            
-            # Ticket Variables
-            page2.add_field(
-                name="Ticket Variables",
-                value="`$(ticket.id)` - Ticket's unique ID number\n"
-                      "`$(ticket.creator)` - User who created ticket\n"
-                      "`$(ticket.category)` - Ticket category name\n"
-                      "`$(ticket.status)` - Current ticket status\n"
-                      "`$(ticket.staff)` - Staff member assigned\n"
-                      "`$(ticket.claimed)` - Is ticket claimed (Yes/No)\n"
-                      "`$(ticket.tags)` - List of ticket tags\n"
-                      "`$(ticket.panel)` - Panel used to create ticket",
-                inline=False
-            )
-            
-            page2.set_footer(text=f"Page 2/2 • Requested by {ctx.author.display_name}", icon_url=ctx.author.display_avatar.url)
-            page2.timestamp = discord.utils.utcnow()
-            pages.append(page2)
+            author_name, author_icon = ctx.author.display_name, ctx.author.display_avatar.url
+            for payload in self._variables_pages(author_name, author_icon):
+                page = discord.Embed.from_dict(payload)
+                page.timestamp = datetime.now(timezone.utc)
+                pages.append(page)
             
             # Create pagination view
-            from src.cogs.help import HelpPaginationView
             view = HelpPaginationView(pages, ctx.author.id, "s.")
             await ctx.reply(embed=pages[0], view=view, mention_author=False)
-            logger.info(f"Variables command used by {ctx.author}")
-            
-        except Exception as e:
-            logger.error(f"Error in variables command: {e}")
-            await ctx.reply("An error occurred while showing variables.", mention_author=False)
+            logger.info("Variables command used by %s", ctx.author)
 
 async def setup_utilities(bot):
     """Setup utilities commands for the bot"""
@@ -6,14 +6,126 @@ Handles backup, restoration, and persistence of all bot configurations
 import json
 import os
 import shutil
+import io
+import tarfile
+import posixpath
 import logging
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List, Any
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from src.database.cloud_backup import cloud_security
+from src.utils.file_io import load_json, read_json, read_json_mapped, dump_json, write_json, link_or_copy, clone_or_copy
+
+# Optional import - ijson lets backup listings skip the large file lists in metadata
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Suffix of single-archive backups, as written by create_tar_backup
+ARCHIVE_SUFFIX = ".tar.gz"
+TRANSCRIPTS_RELPATH = "src/data/transcripts"
+
+
+def _quick_valid(data: bytes) -> bool:
+    """Cheap structural check that JSON bytes could hold a complete object or array"""
+    data = data.strip()
+    return len(data) >= 2 and (data[:1], data[-1:]) in ((b'{', b'}'), (b'[', b']'))
+
+
+# Metadata fields shown in backup listings
+_BACKUP_META_FIELDS = ("backup_name", "timestamp", "total_files")
+
+
+def _read_backup_meta(path: str) -> Dict[str, Any]:
+    """Read the listing fields of a backup's metadata without building files_backed_up"""
+    if not IJSON_AVAILABLE:
+        metadata = read_json_mapped(path)
+        return {key: metadata[key] for key in _BACKUP_META_FIELDS if key in metadata}
+    meta = {}
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in _BACKUP_META_FIELDS and event in ('string', 'number'):
+                meta[prefix] = value
+                if len(meta) == len(_BACKUP_META_FIELDS):
+                    break
+    return meta
+
+
+def _read_archive_meta(path: str) -> Dict[str, Any] | None:
+    """Read the listing fields of an archive backup from its leading metadata member
+
+    Returns None for archives that weren't written by create_tar_backup, such as the
+    secure cloud backups that share the backups folder.
+    """
+    with tarfile.open(path, "r:gz") as tar:
+        member = tar.next()
+        if member is None or member.name != "backup_metadata.json":
+            return None
+        metadata = load_json(tar.extractfile(member).read())
+    return {key: metadata[key] for key in _BACKUP_META_FIELDS if key in metadata}
+
+
+# Contents written for missing data files, serialized once at import
+_DEFAULTS_BYTES = {file_type: dump_json(data) for file_type, data in {
+    "guild_settings": {},
+    "tickets_data": {},
+    "cmd_logging_settings": {},
+    "dm_logging_settings": {},
+    "dm_settings": {},
+    "global_logging": {},
+    "server_join_settings": {},
+    "server_stats": {},
+    "tags_data": {},
+    "saved_embeds": {},
+    "sticky_messages": {},
+    "ticket_settings": {},
+    "reminders": {},
+    "reminder_counter": {"total_reminders": 0},
+    "panels_data": {},
+    "global_cooldown": {"cooldown_seconds": 0},
+    "maintenance": {"enabled": False}
+}.items()}
+
+
+def _dir_size(path: str) -> int:
+    """Total size of the files under a directory, using scandir's cached entry stats"""
+    total = 0
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def _remove_tree(path: str):
+    """Delete a directory tree, using scandir's entry types instead of an lstat per entry"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _ensure_parent(path: str, created_dirs: set):
+    """Create a file's parent directory, once per batch of writes"""
+    parent = os.path.dirname(path)
+    if parent not in created_dirs:
+        os.makedirs(parent, exist_ok=True)
+        created_dirs.add(parent)
+
+
 class DataManager:
     """Centralized manager for all bot data persistence and backup"""
 
@@ -39,44 +151,98 @@ class DataManager:
             "global_cooldown": os.path.join(self.base_dir, "config/global_cooldown.json"),
             "maintenance": os.path.join(self.base_dir, "src/data/maintenance.json")
         }
+        # The file set is fixed, so the hot loops iterate a tuple rather than fresh dict views
+        self._config_paths = tuple(self.config_files.values())
+        # Paths inside a backup mirror the layout under base_dir, so they're resolved once here
+        self._config_relpaths = tuple(os.path.relpath(path, self.base_dir) for path in self._config_paths)
+        # Relative directories holding the config files, created up front when copying
+        self._config_dirs = {os.path.dirname(relpath) for relpath in self._config_relpaths}
+        self._config_relpath_set = frozenset(self._config_relpaths)
+        self._transcripts_dir = os.path.join(self.base_dir, TRANSCRIPTS_RELPATH)
         os.makedirs(self.backup_dir, exist_ok=True)
+        self._present_cache = None
+        # (backup_dir mtime, backups) from the last list_backups scan
+        self._list_cache = (None, None)
+
+    def clear_cache(self):
+        """Forget cached file presence and backup listings after files change on disk"""
+        self._present_cache = None
+        self._list_cache = (None, None)
+
+    def _present_files(self) -> set:
+        """Config paths that currently exist, found with one scandir per data directory"""
+        if self._present_cache is None:
+            listings = {}
+            for path in self._config_paths:
+                parent = os.path.dirname(path)
+                if parent not in listings:
+                    try:
+                        with os.scandir(parent) as entries:
+                            listings[parent] = {entry.name for entry in entries if entry.is_file()}
+                    except OSError:
+                        listings[parent] = set()
+            self._present_cache = {
+                path for path in self._config_paths
+                if os.path.basename(path) in listings[os.path.dirname(path)]
+            }
+        return self._present_cache
+
+    def _plan_backup(self, backup_path: str) -> List[tuple]:
+        """(live path, backup path) for every config file in a backup"""
+        return [(file_path, os.path.join(backup_path, relpath))
+                for file_path, relpath in zip(self._config_paths, self._config_relpaths)]
 
     def create_backup(self, backup_name: str = None) -> str | None:
         """Create a complete backup of all bot data"""
         try:
+            now = datetime.now()
             if not backup_name:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = now.strftime("%Y%m%d_%H%M%S")
                 backup_name = f"sprouts_backup_{timestamp}"
 
             backup_path = os.path.join(self.backup_dir, backup_name)
             os.makedirs(backup_path, exist_ok=True)
 
             backed_up_files = []
-
-            for file_type, file_path in self.config_files.items():
-                if os.path.exists(file_path):
-                    backup_file_path = os.path.join(backup_path, os.path.relpath(file_path, self.base_dir))
-                    os.makedirs(os.path.dirname(backup_file_path), exist_ok=True)
-                    shutil.copy2(file_path, backup_file_path)
+            for config_dir in self._config_dirs:
+                os.makedirs(os.path.join(backup_path, config_dir), exist_ok=True)
+
+            # Files unchanged since the previous backup are linked to its copy instead of copied again
+            previous_path, previous_files = self._previous_snapshot(backup_name)
+            sources, targets = zip(*self._plan_backup(backup_path))
+            bases = [os.path.join(previous_path, relpath) if previous_path else None for relpath in self._config_relpaths]
+            recorded = [previous_files.get(relpath) for relpath in self._config_relpaths]
+
+            # The files are independent, so they are copied concurrently
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                snapshots = list(pool.map(self._snapshot_file, sources, targets, bases, recorded))
+
+            files = {}
+            for file_path, relpath, snapshot in zip(sources, self._config_relpaths, snapshots):
+                if snapshot is not None:
+                    files[relpath] = snapshot
                     backed_up_files.append(file_path)
-                    logger.info(f"Backed up: {os.path.abspath(file_path)}")
+                    logger.info(f"Backed up: {file_path}")
 
-            transcripts_dir = os.path.join(self.base_dir, "src/data/transcripts")
-            if os.path.exists(transcripts_dir):
-                backup_transcripts = os.path.join(backup_path, "src/data/transcripts")
-                shutil.copytree(transcripts_dir, backup_transcripts, dirs_exist_ok=True)
+            if os.path.exists(self._transcripts_dir):
+                backup_transcripts = os.path.join(backup_path, TRANSCRIPTS_RELPATH)
+                # Transcripts are never rewritten, so hard links snapshot them without copying bytes;
+                # config files are rewritten in place and must stay real copies
+                shutil.copytree(self._transcripts_dir, backup_transcripts, copy_function=link_or_copy, dirs_exist_ok=True)
                 logger.info(f"Backed up transcripts directory")
 
             metadata = {
                 "backup_name": backup_name,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "files_backed_up": backed_up_files,
-                "total_files": len(backed_up_files)
+                "total_files": len(backed_up_files),
+                "files": files
             }
 
-            with open(os.path.join(backup_path, "backup_metadata.json"), 'w') as f:
-                json.dump(metadata, f, indent=2)
+            write_json(os.path.join(backup_path, "backup_metadata.json"), metadata)
 
+            # Re-creating an existing backup name doesn't touch backup_dir's mtime
+            self.clear_cache()
             logger.info(f"Created backup '{backup_name}' with {len(backed_up_files)} files")
             return backup_path
         except Exception as e:
@@ -84,39 +250,123 @@ class DataManager:
             return None
 
 
+    def create_tar_backup(self, backup_name: str) -> str | None:
+        """Create a backup as one compressed archive instead of a directory tree
+
+        The metadata is stored as the first member so listings can read it without
+        decompressing the rest. Any directory backup of the same name is replaced.
+        """
+        archive_path = os.path.join(self.backup_dir, f"{backup_name}{ARCHIVE_SUFFIX}")
+        tmp_path = f"{archive_path}.tmp"
+        try:
+            self._present_cache = None
+            present = self._present_files()
+            members = [(file_path, relpath) for file_path, relpath in zip(self._config_paths, self._config_relpaths)
+                       if file_path in present]
+            backed_up_files = [file_path for file_path, _ in members]
+
+            metadata = dump_json({
+                "backup_name": backup_name,
+                "timestamp": datetime.now().isoformat(),
+                "files_backed_up": backed_up_files,
+                "total_files": len(backed_up_files)
+            })
+            metadata_info = tarfile.TarInfo("backup_metadata.json")
+            metadata_info.size = len(metadata)
+
+            # Level 1 keeps startup fast; the JSON still compresses well
+            with tarfile.open(tmp_path, "w:gz", compresslevel=1) as tar:
+                tar.addfile(metadata_info, io.BytesIO(metadata))
+                for file_path, relpath in members:
+                    tar.add(file_path, arcname=relpath)
+                if os.path.isdir(self._transcripts_dir):
+                    tar.add(self._transcripts_dir, arcname=TRANSCRIPTS_RELPATH)
+            os.replace(tmp_path, archive_path)
+
+            # A directory of the same name would otherwise shadow the archive on restore
+            legacy_path = os.path.join(self.backup_dir, backup_name)
+            if os.path.isdir(legacy_path):
+                _remove_tree(legacy_path)
+
+            self.clear_cache()
+            logger.info(f"Created archive backup '{backup_name}' with {len(backed_up_files)} files")
+            return archive_path
+        except Exception as e:
+            logger.error(f"Failed to create archive backup: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+    def _restore_archive(self, backup_name: str, archive_path: str) -> bool:
+        """Restore bot data from a backup created by create_tar_backup"""
+        try:
+            with tarfile.open(archive_path, "r:gz") as tar:
+                first = tar.next()
+                if first is None or first.name != "backup_metadata.json":
+                    logger.error(f"'{backup_name}' is not a data manager backup archive; refusing to restore")
+                    return False
+                members = tar.getmembers()[1:]
+                # create_tar_backup only writes normalised relative names; anything else
+                # (e.g. './config/...') didn't come from it and could dodge the checks below
+                if any(posixpath.normpath(member.name) != member.name or member.name.startswith("/")
+                       for member in members):
+                    logger.error(f"Archive '{backup_name}' has unexpected member names; refusing to restore")
+                    return False
+                if any(member.name == TRANSCRIPTS_RELPATH for member in members) and os.path.exists(self._transcripts_dir):
+                    shutil.rmtree(self._transcripts_dir)
+                # The data filter rejects absolute paths, links out of base_dir and special files
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(self.base_dir, members=members, filter="data")
+                else:
+                    tar.extractall(self.base_dir, members=members)
+
+            restored_files = [member.name for member in members if member.name in self._config_relpath_set]
+            self.clear_cache()
+            logger.info(f"Restored {len(restored_files)} files from archive backup '{backup_name}'")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to restore archive backup '{backup_name}': {e}")
+            return False
+
     def restore_backup(self, backup_name: str) -> bool:
         """Restore bot data from a backup"""
         try:
             backup_path = os.path.join(self.backup_dir, backup_name)
 
             if not os.path.exists(backup_path):
+                archive_path = f"{backup_path}{ARCHIVE_SUFFIX}"
+                if os.path.exists(archive_path):
+                    return self._restore_archive(backup_name, archive_path)
                 logger.error(f"Backup '{backup_name}' not found")
                 return False
 
             metadata_file = os.path.join(backup_path, "backup_metadata.json")
             if os.path.exists(metadata_file):
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
+                metadata = read_json(metadata_file)
                 logger.info(f"Restoring backup from {metadata.get('timestamp', 'unknown time')}")
 
             restored_files = []
-
-            for file_type, file_path in self.config_files.items():
-                backup_file_path = os.path.join(backup_path, os.path.relpath(file_path, self.base_dir))
-                if os.path.exists(backup_file_path):
-                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                    shutil.copy2(backup_file_path, file_path)
+            for config_dir in self._config_dirs:
+                os.makedirs(os.path.join(self.base_dir, config_dir), exist_ok=True)
+
+            targets, sources = zip(*self._plan_backup(backup_path))
+            # The files are independent, so they are copied concurrently
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                copied = list(pool.map(self._copy_if_present, sources, targets))
+            for file_path, was_copied in zip(targets, copied):
+                if was_copied:
                     restored_files.append(file_path)
                     logger.info(f"Restored: {file_path}")
 
-            backup_transcripts = os.path.join(backup_path, "src/data/transcripts")
-            target_transcripts = os.path.join(self.base_dir, "src/data/transcripts")
+            backup_transcripts = os.path.join(backup_path, TRANSCRIPTS_RELPATH)
             if os.path.exists(backup_transcripts):
-                if os.path.exists(target_transcripts):
-                    shutil.rmtree(target_transcripts)
-                shutil.copytree(backup_transcripts, target_transcripts)
+                if os.path.exists(self._transcripts_dir):
+                    shutil.rmtree(self._transcripts_dir)
+                # Restored transcripts must not share inodes with the backup, so clone instead of linking
+                shutil.copytree(backup_transcripts, self._transcripts_dir, copy_function=clone_or_copy)
                 logger.info("Restored transcripts directory")
 
+            self.clear_cache()
             logger.info(f"Restored {len(restored_files)} files from backup '{backup_name}'")
             return True
 
@@ -124,42 +374,116 @@ class DataManager:
             logger.error(f"Failed to restore backup '{backup_name}': {e}")
             return False
 
+    def _previous_snapshot(self, backup_name: str) -> tuple:
+        """Path and per-file stats of the newest other directory backup, if it recorded them"""
+        for _, path, name, _ in self._backups_by_age():
+            if name == backup_name:
+                continue
+            try:
+                files = read_json(os.path.join(path, "backup_metadata.json")).get("files")
+            except (OSError, ValueError):
+                files = None
+            # Only the newest backup is considered; older ones are likelier to be pruned
+            return (path, files) if files else (None, {})
+        return None, {}
+
+    @staticmethod
+    def _snapshot_file(src: str, dst: str, base: str | None, recorded: Dict[str, int] | None) -> Dict[str, int] | None:
+        """Snapshot one config file into a backup, returning its stats or None when it's missing
+
+        Backup copies are never modified, so an unchanged file can share the previous
+        backup's inode. The destination is unlinked first so rewriting a reused backup
+        name never truncates a file another backup links to.
+        """
+        try:
+            st = os.stat(src)
+        except FileNotFoundError:
+            return None
+        try:
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
+
+        stats = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        if base and recorded == stats:
+            try:
+                os.link(base, dst)
+                return stats
+            except OSError:
+                pass
+        try:
+            clone_or_copy(src, dst)
+        except FileNotFoundError:
+            return None
+        return stats
+
+    @staticmethod
+    def _copy_if_present(src: str, dst: str) -> bool:
+        """Copy a file, returning False when the source doesn't exist"""
+        try:
+            clone_or_copy(src, dst)
+            return True
+        except FileNotFoundError:
+            return False
+
     def list_backups(self) -> List[Dict[str, Any]]:
         """List all available backups"""
         backups = []
+        # Backups without metadata have no timestamp and are listed last
+        undated = []
 
         try:
             if not os.path.exists(self.backup_dir):
                 return backups
 
-            for item in os.listdir(self.backup_dir):
-                backup_path = os.path.join(self.backup_dir, item)
-                if os.path.isdir(backup_path):
+            # Backups are only added or removed as directory entries, so an unchanged
+            # mtime means the previous scan is still current
+            mtime = os.stat(self.backup_dir).st_mtime_ns
+            if self._list_cache[0] == mtime:
+                return list(self._list_cache[1])
+
+            with os.scandir(self.backup_dir) as entries:
+                listing = [(entry.name, entry.path, entry.is_dir()) for entry in entries]
+
+            for item, backup_path, is_dir in listing:
+                if is_dir:
                     metadata_file = os.path.join(backup_path, "backup_metadata.json")
 
                     backup_info = {"name": item, "path": backup_path}
 
                     if os.path.exists(metadata_file):
                         try:
-                            with open(metadata_file, 'r') as f:
-                                metadata = json.load(f)
-                            backup_info.update(metadata)
+                            backup_info.update(_read_backup_meta(metadata_file))
                         except Exception:
                             pass
 
                     try:
-                        total_size = sum(
-                            os.path.getsize(os.path.join(dirpath, filename))
-                            for dirpath, dirnames, filenames in os.walk(backup_path)
-                            for filename in filenames
-                        )
+                        total_size = _dir_size(backup_path)
                         backup_info["size_mb"] = float(round(total_size / (1024 * 1024), 2))
                     except Exception:
                         backup_info["size_mb"] = 0.0
 
-                    backups.append(backup_info)
+                    (backups if "timestamp" in backup_info else undated).append(backup_info)
 
-            backups.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+                elif item.endswith(ARCHIVE_SUFFIX):
+                    try:
+                        archive_meta = _read_archive_meta(backup_path)
+                    except Exception:
+                        archive_meta = None
+                    # Skip archives that other backup systems keep in the same folder
+                    if archive_meta is None:
+                        continue
+                    backup_info = {"name": item[:-len(ARCHIVE_SUFFIX)], "path": backup_path, **archive_meta}
+                    try:
+                        backup_info["size_mb"] = float(round(os.path.getsize(backup_path) / (1024 * 1024), 2))
+                    except OSError:
+                        backup_info["size_mb"] = 0.0
+
+                    (backups if "timestamp" in backup_info else undated).append(backup_info)
+
+            backups.sort(key=itemgetter("timestamp"), reverse=True)
+            backups.extend(undated)
+            self._list_cache = (mtime, list(backups))
 
         except Exception as e:
             logger.error(f"Error listing backups: {e}")
@@ -168,68 +492,79 @@ class DataManager:
 
     def verify_data_integrity(self) -> Dict[str, bool]:
         """Verify that all critical data files exist and are valid"""
+        self._present_cache = None
+        present = self._present_files()
         integrity_report = {}
-
-        for file_type, file_path in self.config_files.items():
-            try:
-                if os.path.exists(file_path):
-                    with open(file_path, 'r') as f:
-                        json.load(f)
-                    integrity_report[file_type] = True
-                else:
-                    integrity_report[file_type] = False
-                    logger.warning(f"Missing data file: {file_path}")
-            except json.JSONDecodeError:
-                integrity_report[file_type] = False
-                logger.error(f"Corrupted JSON file: {file_path}")
-            except Exception as e:
+        existing = []
+        for file_type, file_path in zip(self.config_files, self._config_paths):
+            if file_path in present:
+                existing.append((file_type, file_path))
+            else:
+                logger.warning(f"Missing data file: {file_path}")
                 integrity_report[file_type] = False
-                logger.error(f"Error checking {file_path}: {e}")
 
-        return integrity_report
+        # Only files that exist are worth a worker; they are read and parsed concurrently
+        if existing:
+            with ThreadPoolExecutor(max_workers=min(8, len(existing))) as pool:
+                results = pool.map(self._check_data_file, [file_path for _, file_path in existing])
+                for (file_type, _), result in zip(existing, results):
+                    integrity_report[file_type] = result
+
+        # Keep the report in config order regardless of which files were missing
+        return {file_type: integrity_report[file_type] for file_type in self.config_files}
+
+    @staticmethod
+    def _check_data_file(file_path: str) -> bool:
+        """Check that a single data file holds valid JSON"""
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            # Truncated writes lose the closing bracket, so those fail without a parse;
+            # a matching outer pair says nothing about the inside, so it still gets one
+            if not _quick_valid(data):
+                logger.error(f"Corrupted JSON file: {file_path}")
+                return False
+            load_json(data)
+            return True
+        except FileNotFoundError:
+            logger.warning(f"Missing data file: {file_path}")
+        except json.JSONDecodeError:
+            logger.error(f"Corrupted JSON file: {file_path}")
+        except Exception as e:
+            logger.error(f"Error checking {file_path}: {e}")
+        return False
 
     def create_empty_defaults(self):
         """Create empty default files for missing configurations"""
-        defaults = {
-            "guild_settings": {},
-            "tickets_data": {},
-            "cmd_logging_settings": {},
-            "dm_logging_settings": {},
-            "dm_settings": {},
-            "global_logging": {},
-            "server_join_settings": {},
-            "server_stats": {},
-            "tags_data": {},
-            "saved_embeds": {},
-            "sticky_messages": {},
-            "ticket_settings": {},
-            "reminders": {},
-            "reminder_counter": {"total_reminders": 0},
-            "panels_data": {},
-            "global_cooldown": {"cooldown_seconds": 0},
-            "maintenance": {"enabled": False}
-        }
-
-        for file_type, default_data in defaults.items():
+        created_dirs = set()
+        self._present_cache = None
+        present = self._present_files()
+        for file_type, default_bytes in _DEFAULTS_BYTES.items():
             if file_type in self.config_files:
                 file_path = self.config_files[file_type]
-                if not os.path.exists(file_path):
+                if file_path not in present:
                     try:
-                        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                        with open(file_path, 'w') as f:
-                            json.dump(default_data, f, indent=2)
+                        _ensure_parent(file_path, created_dirs)
+                        # Exclusive create: a file that appeared since the scan is never overwritten
+                        with open(file_path, 'xb') as f:
+                            f.write(default_bytes)
                         logger.info(f"Created default file: {file_path}")
+                    except FileExistsError:
+                        pass
                     except Exception as e:
                         logger.error(f"Failed to create default file {file_path}: {e}")
+        self._present_cache = None
 
     async def auto_backup_on_startup(self):
         """Create an automatic backup when the bot starts"""
         try:
             is_fresh_deployment = self.detect_fresh_deployment()
-            has_data = any(os.path.exists(path) for path in self.config_files.values())
+            has_data = bool(self._present_files())
 
             if has_data:
-                backup_path = self.create_backup("startup_backup")
+                # Copying the data files is blocking I/O; keep it off the event loop
+                # Startup snapshots are only ever restored whole, so one archive replaces the tree
+                backup_path = await asyncio.to_thread(self.create_tar_backup, "startup_backup")
                 try:
                     cloud_backup = cloud_security.create_secure_backup("startup_secure_backup")
                     if cloud_backup.get("success"):
@@ -254,7 +589,7 @@ class DataManager:
         try:
             indicators = [
                 os.path.exists(os.path.join(self.base_dir, '.git')),
-                len([path for path in self.config_files.values() if os.path.exists(path)]) < 3,
+                len(self._present_files()) < 3,
                 not os.path.exists(self.backup_dir) or len(os.listdir(self.backup_dir)) == 0
             ]
             is_fresh = sum(indicators) >= 2
@@ -271,12 +606,13 @@ class DataManager:
             github_backup_file = os.path.join(self.base_dir, "github_restore_backup.json")
             if os.path.exists(github_backup_file):
                 logger.info("Found GitHub restore backup file")
-                with open(github_backup_file, 'r') as f:
-                    restore_data = json.load(f)
+                restore_data = read_json_mapped(github_backup_file)
                 backup_name = restore_data.get('backup_name')
-                if backup_name and os.path.exists(os.path.join(self.backup_dir, backup_name)):
+                backup_path = os.path.join(self.backup_dir, backup_name) if backup_name else None
+                # Startup backups are stored as archives, which restore_backup also handles
+                if backup_path and (os.path.exists(backup_path) or os.path.exists(f"{backup_path}{ARCHIVE_SUFFIX}")):
                     logger.info(f"Auto-restoring from GitHub backup: {backup_name}")
-                    success = self.restore_backup(backup_name)
+                    success = await asyncio.to_thread(self.restore_backup, backup_name)
                     if success:
                         logger.info("Successfully restored data from GitHub backup")
                         os.remove(github_backup_file)
@@ -300,27 +636,49 @@ class DataManager:
                 "description": "This file triggers automatic data restoration on GitHub deployment"
             }
             github_restore_path = os.path.join(self.base_dir, "github_restore_backup.json")
-            with open(github_restore_path, 'w') as f:
-                json.dump(restore_data, f, indent=2)
+            write_json(github_restore_path, restore_data)
             logger.info(f"Created GitHub restore file for backup: {backup_name}")
             return True
         except Exception as e:
             logger.error(f"Error creating GitHub restore file: {e}")
             return False
 
+    def _backups_by_age(self, backup_prefix: str = None, include_archives: bool = False) -> List[tuple]:
+        """(mtime, path, name, is_archive) for each backup, newest first
+
+        Directory backups are always included; archive backups only when asked for,
+        and only those written by create_tar_backup.
+        """
+        backups = []
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    name, is_archive = entry.name, False
+                elif include_archives and entry.name.endswith(ARCHIVE_SUFFIX):
+                    name, is_archive = entry.name[:-len(ARCHIVE_SUFFIX)], True
+                else:
+                    continue
+                if backup_prefix and not name.startswith(backup_prefix):
+                    continue
+                if is_archive:
+                    try:
+                        if _read_archive_meta(entry.path) is None:
+                            continue
+                    except Exception:
+                        continue
+                backups.append((entry.stat(follow_symlinks=False).st_mtime, entry.path, name, is_archive))
+        backups.sort(reverse=True)
+        return backups
+
     async def cleanup_old_backups(self, backup_prefix: str = None, keep_count: int = 10):
         """Clean up old backups to save space"""
         try:
-            backups = self.list_backups()
-            if backup_prefix:
-                backups = [b for b in backups if b["name"].startswith(backup_prefix)]
-            if len(backups) > keep_count:
-                to_remove = backups[keep_count:]
-                for backup in to_remove:
-                    backup_path = backup["path"]
-                    if os.path.exists(backup_path):
-                        shutil.rmtree(backup_path)
-                        logger.info(f"Cleaned up old backup: {backup['name']}")
+            # Only names and ages are needed here, not list_backups' metadata and sizes
+            backups = await asyncio.to_thread(self._backups_by_age, backup_prefix, True)
+            for _, backup_path, backup_name, is_archive in backups[keep_count:]:
+                await asyncio.to_thread(os.remove if is_archive else _remove_tree, backup_path)
+                self.clear_cache()
+                logger.info(f"Cleaned up old backup: {backup_name}")
         except Exception as e:
             logger.error(f"Error cleaning up backups: {e}")
 
@@ -13,6 +13,7 @@ import gzip
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 import asyncio
+from src.utils.file_io import read_json, write_json, link_or_copy
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,8 @@ class CloudDataSecurity:
             "src/data/sticky_messages.json",
             "src/data/reminders.json"
         ]
+        # The critical files live in a couple of directories, created once per backup/restore
+        self.critical_dirs = sorted({os.path.dirname(file_path) for file_path in self.critical_files})
     
     def calculate_file_hash(self, file_path: str) -> str:
         """Calculate MD5 hash of file for integrity checking"""
@@ -72,15 +75,17 @@ class CloudDataSecurity:
                 "description": "Enhanced secure backup with integrity verification"
             }
             
+            # Create directory structure in backup
+            for critical_dir in self.critical_dirs:
+                os.makedirs(os.path.join(backup_path, critical_dir), exist_ok=True)
+
             # Backup all critical files
             files_backed_up = 0
             for file_path in self.critical_files:
                 if os.path.exists(file_path):
                     try:
-                        # Create directory structure in backup
                         backup_file_path = os.path.join(backup_path, file_path)
-                        os.makedirs(os.path.dirname(backup_file_path), exist_ok=True)
-                        
+
                         # Copy file
                         shutil.copy2(file_path, backup_file_path)
                         
@@ -104,7 +109,9 @@ class CloudDataSecurity:
             if os.path.exists(transcripts_source):
                 transcripts_backup = os.path.join(backup_path, transcripts_source)
                 try:
-                    shutil.copytree(transcripts_source, transcripts_backup)
+                    # Transcripts are write-once and this staging tree is archived then deleted,
+                    # so hard links avoid copying every transcript before compression
+                    shutil.copytree(transcripts_source, transcripts_backup, copy_function=link_or_copy)
                     # Count transcript files
                     transcript_count = len([f for f in os.listdir(transcripts_source) 
                                           if f.endswith('.html')])
@@ -117,8 +124,7 @@ class CloudDataSecurity:
             
             # Save backup manifest
             manifest_path = os.path.join(backup_path, "backup_manifest.json")
-            with open(manifest_path, 'w') as f:
-                json.dump(backup_manifest, f, indent=2)
+            write_json(manifest_path, backup_manifest)
             
             # Compress backup for space efficiency
             self.compress_backup(backup_path)
@@ -166,8 +172,7 @@ class CloudDataSecurity:
             
             # Load manifest
             manifest_path = os.path.join(temp_extract, backup_name, "backup_manifest.json")
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            manifest = read_json(manifest_path)
             
             verification_results = {
                 "backup_name": backup_name,
@@ -223,17 +228,18 @@ class CloudDataSecurity:
             
             # Load manifest
             manifest_path = os.path.join(temp_extract, backup_name, "backup_manifest.json")
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            manifest = read_json(manifest_path)
             
+            # Ensure directories exist
+            for restore_dir in {os.path.dirname(file_path) for file_path in manifest["files"]}:
+                if restore_dir:
+                    os.makedirs(restore_dir, exist_ok=True)
+
             # Restore each file
             for file_path in manifest["files"].keys():
                 backup_file_path = os.path.join(temp_extract, backup_name, file_path)
                 if os.path.exists(backup_file_path):
                     try:
-                        # Ensure directory exists
-                        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                        
                         # Restore file
                         shutil.copy2(backup_file_path, file_path)
                         restore_results["restored_files"] += 1
@@ -0,0 +1,116 @@
+"""
+Shared File I/O Helpers
+JSON reads/writes through orjson when available, and kernel-side file copies for backups
+"""
+
+import json
+import os
+import shutil
+import mmap
+from typing import Any
+
+# Optional import - fcntl (POSIX only) enables copy-on-write clones for backups
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Optional import - orjson parses and serializes several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ioctl request that clones a file's extents (reflink) on btrfs/XFS
+FICLONE = 0x40049409
+# copy_file_range (Linux 4.5+) copies between descriptors inside the kernel
+COPY_FILE_RANGE_AVAILABLE = hasattr(os, "copy_file_range")
+COPY_CHUNK_SIZE = 1 << 20
+
+
+def load_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: str) -> Any:
+    """Load a JSON file"""
+    with open(path, 'rb') as f:
+        return load_json(f.read())
+
+
+def read_json_mapped(path: str) -> Any:
+    """Load a JSON file by handing orjson a memory map instead of a read() copy"""
+    if ORJSON_AVAILABLE:
+        try:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        except orjson.JSONDecodeError:
+            raise
+        except ValueError:
+            # Empty files can't be mapped
+            pass
+    return read_json(path)
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def write_json(path: str, data: Any):
+    """Write data as indented JSON"""
+    with open(path, 'wb') as f:
+        f.write(dump_json(data))
+
+
+def link_or_copy(src: str, dst: str):
+    """Hard-link a write-once file into a backup, copying when linking isn't possible"""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        # Reused backup names may already hold this exact file
+        if not os.path.samefile(src, dst):
+            clone_or_copy(src, dst)
+    except OSError:
+        clone_or_copy(src, dst)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int):
+    """Copy a whole file without passing its bytes through userspace"""
+    if FCNTL_AVAILABLE:
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return
+        except OSError:
+            pass
+    if not COPY_FILE_RANGE_AVAILABLE:
+        raise OSError("copy_file_range is not available")
+    while os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE):
+        pass
+
+
+def clone_or_copy(src: str, dst: str):
+    """Copy a file as a copy-on-write clone when the filesystem supports it
+
+    A reflink shares the source's extents until either side is modified, so the
+    backup stays a true snapshot without moving any bytes. Otherwise the copy
+    stays in the kernel with copy_file_range, and falls back to a regular copy
+    where neither is supported.
+    """
+    if FCNTL_AVAILABLE or COPY_FILE_RANGE_AVAILABLE:
+        try:
+            with open(src, 'rb') as s, open(dst, 'wb') as d:
+                _kernel_copy(s.fileno(), d.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
@@ -0,0 +1,61 @@
+"""
+Shared Command Cooldowns for Clustered Deployments
+Keeps per-user/guild cooldowns in Redis so they apply across every cluster process
+"""
+
+import logging
+from typing import Optional
+from discord.ext import commands
+from config import REDIS_URL
+
+# Optional import - without redis the in-process cooldowns are the only limit
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_client = None
+
+# Seconds before a slow or unreachable Redis gives up, so a command check never
+# stalls for long before falling back to the local cooldown
+REDIS_TIMEOUT = 0.5
+
+
+def get_redis_client() -> Optional["aioredis.Redis"]:
+    """Get the shared Redis client, or None when Redis isn't configured"""
+    global _client
+    if _client is None and REDIS_URL and REDIS_AVAILABLE:
+        _client = aioredis.from_url(REDIS_URL, socket_connect_timeout=REDIS_TIMEOUT, socket_timeout=REDIS_TIMEOUT)
+    return _client
+
+
+def shared_cooldown(per: float, bucket: commands.BucketType = commands.BucketType.user):
+    """Command check enforcing one use per `per` seconds across all clusters
+
+    Uses an atomic Redis ``SET NX PX`` per bucket key. When Redis is not
+    configured or unreachable the check passes, leaving the regular
+    ``commands.cooldown`` decorator as the in-process limit.
+    """
+    cooldown = commands.Cooldown(1, per)
+    per_ms = int(per * 1000)
+
+    async def predicate(ctx):
+        client = get_redis_client()
+        if client is None:
+            return True
+
+        key = f"sprouts:cooldown:{ctx.command.qualified_name}:{bucket.get_key(ctx.message)}"
+        try:
+            if await client.set(key, 1, nx=True, px=per_ms):
+                return True
+            retry_after = max(await client.pttl(key), 0) / 1000
+        except Exception as e:
+            logger.warning(f"Shared cooldown unavailable, falling back to local cooldown: {e}")
+            return True
+
+        raise commands.CommandOnCooldown(cooldown, retry_after, bucket)
+
+    return commands.check(predicate)
@@ -13,6 +13,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Matches $(name) tokens so each variable table is applied in a single pass; names
+# are limited to word characters and dots so an unclosed "$(" can't swallow the next token
+_VAR_RE = re.compile(r'\$\(([\w.]+)\)')
+
+
+def _substitute(text: str, variables: Dict[str, Any]) -> str:
+    """Replace every known $(name) token in one scan, leaving unknown ones intact"""
+    return _VAR_RE.sub(lambda m: str(variables[m.group(1)]) if m.group(1) in variables else m.group(0), text)
+
+
 class VariableProcessor:
     """Advanced variable processor supporting complex variables and operations"""
     
@@ -28,7 +38,7 @@ class VariableProcessor:
         ticket_data: Dict[str, Any] = None
     ) -> str:
         """Process all variables in text with comprehensive support"""
-        if not text:
+        if not text or '$(' not in text:
             return text
             
         processed_text = text
@@ -50,20 +60,17 @@ class VariableProcessor:
             return text
             
         variables = {
-            r'\$\(user\.name\)': user.name,
-            r'\$\(user\.mention\)': user.mention,
-            r'\$\(user\.id\)': str(user.id),
-            r'\$\(user\.nick\)': user.display_name if hasattr(user, 'display_name') else user.name,
-            r'\$\(user\.tag\)': str(user),
-            r'\$\(user\.avatar\)': user.display_avatar.url,
-            r'\$\(user\.joined\)': user.joined_at.strftime('%B %d, %Y') if hasattr(user, 'joined_at') and user.joined_at else 'Unknown',
-            r'\$\(user\.created\)': user.created_at.strftime('%B %d, %Y')
+            'user.name': user.name,
+            'user.mention': user.mention,
+            'user.id': str(user.id),
+            'user.nick': user.display_name if hasattr(user, 'display_name') else user.name,
+            'user.tag': str(user),
+            'user.avatar': user.display_avatar.url,
+            'user.joined': user.joined_at.strftime('%B %d, %Y') if hasattr(user, 'joined_at') and user.joined_at else 'Unknown',
+            'user.created': user.created_at.strftime('%B %d, %Y')
         }
         
-        for pattern, replacement in variables.items():
-            text = re.sub(pattern, str(replacement), text)
-            
-        return text
+        return _substitute(text, variables)
     
     async def _process_server_variables(self, text: str, guild: discord.Guild = None) -> str:
         """Process server-related variables"""
@@ -71,20 +78,17 @@ class VariableProcessor:
             return text
             
         variables = {
-            r'\$\(server\.name\)': guild.name,
-            r'\$\(server\.membercount\)': str(guild.member_count),
-            r'\$\(server\.owner\)': str(guild.owner) if guild.owner else 'Unknown',
-            r'\$\(server\.id\)': str(guild.id),
-            r'\$\(server\.icon\)': guild.icon.url if guild.icon else 'No icon',
-            r'\$\(server\.created\)': guild.created_at.strftime('%B %d, %Y'),
-            r'\$\(server\.boosts\)': str(guild.premium_subscription_count or 0),
-            r'\$\(server\.channels\)': str(len(guild.channels))
+            'server.name': guild.name,
+            'server.membercount': str(guild.member_count),
+            'server.owner': str(guild.owner) if guild.owner else 'Unknown',
+            'server.id': str(guild.id),
+            'server.icon': guild.icon.url if guild.icon else 'No icon',
+            'server.created': guild.created_at.strftime('%B %d, %Y'),
+            'server.boosts': str(guild.premium_subscription_count or 0),
+            'server.channels': str(len(guild.channels))
         }
         
-        for pattern, replacement in variables.items():
-            text = re.sub(pattern, str(replacement), text)
-            
-        return text
+        return _substitute(text, variables)
     
     async def _process_channel_variables(self, text: str, channel: discord.TextChannel = None) -> str:
         """Process channel-related variables"""
@@ -92,41 +96,35 @@ class VariableProcessor:
             return text
             
         variables = {
-            r'\$\(channel\.name\)': channel.name,
-            r'\$\(channel\.id\)': str(channel.id),
-            r'\$\(channel\.mention\)': channel.mention,
-            r'\$\(channel\.topic\)': channel.topic or 'No topic set',
-            r'\$\(channel\.category\)': channel.category.name if channel.category else 'No category',
-            r'\$\(channel\.position\)': str(channel.position),
-            r'\$\(channel\.created\)': channel.created_at.strftime('%B %d, %Y'),
-            r'\$\(channel\.nsfw\)': 'Yes' if channel.nsfw else 'No',
-            r'\$\(channel\.slowmode\)': f"{channel.slowmode_delay} seconds" if channel.slowmode_delay else 'Disabled'
+            'channel.name': channel.name,
+            'channel.id': str(channel.id),
+            'channel.mention': channel.mention,
+            'channel.topic': channel.topic or 'No topic set',
+            'channel.category': channel.category.name if channel.category else 'No category',
+            'channel.position': str(channel.position),
+            'channel.created': channel.created_at.strftime('%B %d, %Y'),
+            'channel.nsfw': 'Yes' if channel.nsfw else 'No',
+            'channel.slowmode': f"{channel.slowmode_delay} seconds" if channel.slowmode_delay else 'Disabled'
         }
         
-        for pattern, replacement in variables.items():
-            text = re.sub(pattern, str(replacement), text)
-            
-        return text
+        return _substitute(text, variables)
     
     async def _process_time_variables(self, text: str) -> str:
         """Process time-related variables"""
         now = datetime.now()
         
         variables = {
-            r'\$\(time\)': now.strftime('%H:%M:%S'),
-            r'\$\(date\)': now.strftime('%m/%d/%Y'),
-            r'\$\(datetime\)': now.strftime('%m/%d/%Y %H:%M:%S'),
-            r'\$\(year\)': str(now.year),
-            r'\$\(month\)': now.strftime('%B'),
-            r'\$\(day\)': str(now.day),
-            r'\$\(weekday\)': now.strftime('%A'),
-            r'\$\(timestamp\)': str(int(now.timestamp()))
+            'time': now.strftime('%H:%M:%S'),
+            'date': now.strftime('%m/%d/%Y'),
+            'datetime': now.strftime('%m/%d/%Y %H:%M:%S'),
+            'year': str(now.year),
+            'month': now.strftime('%B'),
+            'day': str(now.day),
+            'weekday': now.strftime('%A'),
+            'timestamp': str(int(now.timestamp()))
         }
         
-        for pattern, replacement in variables.items():
-            text = re.sub(pattern, replacement, text)
-            
-        return text
+        return _substitute(text, variables)
     
     async def _process_math_variables(self, text: str) -> str:
         """Process math operations"""
@@ -238,21 +236,18 @@ class VariableProcessor:
         staff_name = claimed_by.display_name if claimed_by else 'Unassigned'
         
         variables = {
-            r'\$\(ticket\.id\)': str(ticket_id),
-            r'\$\(ticket\.creator\)': creator_name,
-            r'\$\(ticket\.category\)': ticket_data.get('category', 'General'),
-            r'\$\(ticket\.status\)': ticket_data.get('status', 'open'),
-            r'\$\(ticket\.staff\)': staff_name,
-            r'\$\(ticket\.claimed\)': 'Yes' if claimed_by_id else 'No',
-            r'\$\(ticket\.tags\)': ', '.join(ticket_data.get('tags', [])) or 'None',
-            r'\$\(ticket\.panel\)': ticket_data.get('panel_name', 'Direct'),
-            r'\$\(ticket\.transcript\)': f"transcript_{ticket_id}.html"
+            'ticket.id': str(ticket_id),
+            'ticket.creator': creator_name,
+            'ticket.category': ticket_data.get('category', 'General'),
+            'ticket.status': ticket_data.get('status', 'open'),
+            'ticket.staff': staff_name,
+            'ticket.claimed': 'Yes' if claimed_by_id else 'No',
+            'ticket.tags': ', '.join(ticket_data.get('tags', [])) or 'None',
+            'ticket.panel': ticket_data.get('panel_name', 'Direct'),
+            'ticket.transcript': f"transcript_{ticket_id}.html"
         }
         
-        for pattern, replacement in variables.items():
-            text = re.sub(pattern, str(replacement), text)
-            
-        return text
+        return _substitute(text, variables)
     
     def get_all_variables_help(self) -> str:
         """Return comprehensive help text for all available variables"""